@@ -0,0 +1,136 @@
+import json
+
+import knowledge_store
+
+# Token estimate used for budgets: about four characters of JSON per token, which is close
+# enough for trimming decisions and costs only a len().
+CHARS_PER_TOKEN = 4
+
+# Keys of knowledge content that is dropped first when a response is over budget, at any depth.
+EXAMPLE_KEYS = {"example", "examples", "Example", "Examples"}
+PARTIAL_CONTENT = ("Widgets", "Variables", "Actions")
+
+
+def estimate_tokens(text):
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def _tokens(value):
+    return estimate_tokens(json.dumps(value))
+
+
+def without_examples(entry):
+    """Copy of a knowledge entry without its examples: example sections and fields at any depth
+    and the "// Example: ... // Explanation: ..." tails of event strings."""
+    if isinstance(entry, dict):
+        return {key: without_examples(value) for key, value in entry.items() if key not in EXAMPLE_KEYS}
+    if isinstance(entry, list):
+        return [without_examples(value) for value in entry]
+    if isinstance(entry, str):
+        return knowledge_store.event_signature(entry)
+    return entry
+
+
+def fit_to_budget(context, fragments, max_tokens, table=None, lookup=None):
+    """Trim a page context and knowledge fragments until the response estimate fits `max_tokens`.
+
+    Content is dropped lowest priority first: knowledge examples, then knowledge entries, then
+    prefabs, the App block and the contents of the page's partials (last on the page first).
+    The page's own widgets, variables and metadata are always kept. `fragments` are (key,
+    member) pairs as returned by KnowledgeSnapshot.lookup_parts; examples are only stripped
+    from whole entries, so pass the snapshot's `table` only for unprojected lookups.
+    The estimate covers the whole response: the "budget" report and, if `lookup` (the rest of
+    lookup_parts: resolved, unresolved, unchanged, unmatched) is given, the other members
+    written by knowledge_store.format_lookup.
+
+    The inputs are shared cached data and are not modified; trimmed parts are copied. Returns
+    (context, fragments, elided paths, estimated tokens).
+    """
+    fragments = dict(fragments)
+    total = (_tokens(context) if context else 0) + sum(estimate_tokens(fragment) for fragment in fragments.values())
+    elided = []
+
+    def estimate():
+        return total + _overhead_tokens(max_tokens, elided, fragments, lookup)
+
+    if estimate() <= max_tokens:
+        return context, list(fragments.items()), elided, estimate()
+
+    if table is not None:
+        for key in reversed(list(fragments)):
+            if estimate() <= max_tokens:
+                break
+            stripped = without_examples(table[key])
+            if stripped == table[key]:
+                continue
+            fragment = knowledge_store.canonical_json(key) + ":" + knowledge_store.canonical_json(stripped)
+            total -= estimate_tokens(fragments[key]) - estimate_tokens(fragment)
+            fragments[key] = fragment
+            elided.append(f"knowledge.{key}.examples")
+    for key in reversed(list(fragments)):
+        if estimate() <= max_tokens:
+            break
+        total -= estimate_tokens(fragments.pop(key))
+        elided.append(f"knowledge.{key}")
+
+    if estimate() > max_tokens and context and context.get("appContext"):
+        context = dict(context)
+        app_context = context["appContext"] = dict(context["appContext"])
+        for section in ("prefabs", "App"):
+            if estimate() > max_tokens and section in app_context:
+                total -= _tokens(app_context.pop(section))
+                elided.append(f"appContext.{section}")
+        page_type = context["projectDetails"]["pageType"]
+        page = app_context[page_type] = dict(app_context[page_type])
+        widgets = page["Widgets"] = dict(page["Widgets"])
+        partials = [name for name, widget in widgets.items() if widget.get("type") == "partial" and widget.get("Widgets")]
+        for name in reversed(partials):
+            if estimate() <= max_tokens:
+                break
+            widget = widgets[name]
+            total -= _tokens({section: widget[section] for section in PARTIAL_CONTENT}) - _tokens(dict.fromkeys(PARTIAL_CONTENT))
+            widgets[name] = {**widget, **dict.fromkeys(PARTIAL_CONTENT)}
+            elided.append(f"appContext.{page_type}.Widgets.{name}")
+    return context, list(fragments.items()), elided, estimate()
+
+
+def _report(max_tokens, estimated_tokens, elided):
+    return {"maxTokens": max_tokens, "estimatedTokens": estimated_tokens, "elided": elided}
+
+
+def _overhead_tokens(max_tokens, elided, fragments, lookup):
+    """Tokens of a response beyond its context and fragment contents: the braces and separators,
+    the "budget" report and the other lookup members ("hashes", "resolved", ...)."""
+    # The report's own estimate is not known yet; leave room for a long number.
+    chars = len('{,"budget":}') + len(json.dumps(_report(max_tokens, 10 ** 9, elided)))
+    if lookup is not None:
+        # Fragment contents are already counted; hashes have a fixed length.
+        members = knowledge_store.format_lookup([(key, "") for key in fragments], *lookup)
+        chars += 1 + len(",".join(members))
+    return -(-chars // CHARS_PER_TOKEN)
+
+
+def add_budget_report(json_object, max_tokens, elided):
+    """Append a "budget" member reporting the limit, the estimate of the whole response and what was
+    elided (elided partials keep their entry, with null contents)."""
+    report = _report(max_tokens, 0, elided)
+    separator = "," if json_object != "{}" else ""
+    while True:
+        # The estimate is part of the response it measures; a few rounds settle its length.
+        response = json_object[:-1] + separator + '"budget":' + json.dumps(report) + "}"
+        tokens = estimate_tokens(response)
+        if tokens == report["estimatedTokens"]:
+            return response
+        report["estimatedTokens"] = tokens
+
+
+def lookup(platform, keys, sections=None, members=None, max_tokens=None, known_hashes=None):
+    """knowledge_store.lookup trimmed to `max_tokens`, with a "budget" report."""
+    if max_tokens is None:
+        return knowledge_store.lookup(platform, keys, sections, members, known_hashes)
+    snapshot = knowledge_store.current()
+    fragments, *lookup = snapshot.lookup_parts(platform, keys, sections, members, known_hashes)
+    table = snapshot.table(platform) if sections is None and members is None else None
+    _, fragments, elided, _ = fit_to_budget(None, fragments, max_tokens, table, lookup)
+    json_object = "{" + ",".join(knowledge_store.format_lookup(fragments, *lookup)) + "}"
+    return add_budget_report(json_object, max_tokens, elided)
@@ -1,26 +1,67 @@
-import requests
+import asyncio
+import hashlib
 import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from typing import NamedTuple
 from urllib.parse import unquote_plus
 from bs4 import BeautifulSoup
 
+import budget
+import knowledge_store
+import studio_client
+from cache import TTLCache
+
 # You may want to set this globally or pass as a parameter
 origin = "https://www.wavemakeronline.com"  # <-- Set this appropriately
 
-def get_api_response(url, auth_cookie):
+# Markup parsing and serialization run on a small thread pool instead of the event loop; the
+# pool's size bounds the CPU work of all page contexts being built at the same time, while their
+# Studio fetches wait on the network without holding any slot.
+PARSE_WORKERS = int(os.environ.get("CONTEXT_PARSE_WORKERS", "4"))
+_parse_executor = ThreadPoolExecutor(max_workers=PARSE_WORKERS, thread_name_prefix="context-parse")
+
+# Service definitions and types change far less often than pages and are shared by every
+# variable bound to the same service.
+SERVICE_CATALOG_TTL = float(os.environ.get("SERVICE_CATALOG_TTL", "300"))
+SERVICE_CATALOG_SIZE = int(os.environ.get("SERVICE_CATALOG_SIZE", "256"))
+_service_catalogs = TTLCache(SERVICE_CATALOG_SIZE, SERVICE_CATALOG_TTL)
+
+# Parsed markup and variables keyed by a hash of their encoded content. Pages rarely change
+# between consecutive turns, so these skip decoding and parsing for unchanged content.
+MARKUP_MEMO_SIZE = int(os.environ.get("MARKUP_MEMO_SIZE", "256"))
+_parsed_markup = TTLCache(MARKUP_MEMO_SIZE)
+_decoded_variables = TTLCache(MARKUP_MEMO_SIZE)
+_resolved_variables = TTLCache(MARKUP_MEMO_SIZE)
+
+# The App block (Common page widgets plus app-level variables) is the same for every page of a
+# project, so it is built once per project and auth scope and reused for as long as the Common
+# page and app variables it was built from are unchanged. They are checked again at most every
+# APP_CONTEXT_FRESH seconds, so most pages pay only for their own fetches.
+APP_CONTEXT_FRESH = float(os.environ.get("APP_CONTEXT_FRESH", "5"))
+APP_CONTEXT_TTL = float(os.environ.get("APP_CONTEXT_TTL", "300"))
+APP_CONTEXT_CACHE_SIZE = int(os.environ.get("APP_CONTEXT_CACHE_SIZE", "128"))
+_app_contexts = TTLCache(APP_CONTEXT_CACHE_SIZE, APP_CONTEXT_TTL)
+_app_context_generations = {}
+
+def auth_headers(auth_cookie):
+    return {
+        "Cookie" :
+            f'auth_cookie = {auth_cookie}'
+    }
+
+async def get_api_response(url, auth_cookie, missing=None):
+    """Parsed JSON body of `url`; `missing` if Studio says it does not exist (404 / 410), None on any other failure."""
     try:
-        headers = {
-            "Cookie" :
-                f'auth_cookie = {auth_cookie}'
-        }
-        response = requests.get(url, headers=headers, allow_redirects=True)
-        response.raise_for_status()
-        return response.json()
-    except Exception:
-        return None
+        return await studio_client.get_json(url, headers=auth_headers(auth_cookie))
+    except Exception as error:
+        return missing if studio_client.is_missing(error) else None
 
-def get_project_metadata(project_id, auth_cookie):
+async def get_project_metadata(project_id, auth_cookie):
     details_url = f"{origin}/studio/services/projects/{project_id}/details"
-    project_details = get_api_response(details_url, auth_cookie)
+    project_details = await get_api_response(details_url, auth_cookie)
     if not project_details:
         return {}
     return {
@@ -28,9 +69,9 @@ def get_project_metadata(project_id, auth_cookie):
         "projectType": project_details.get("platformType")
     }
 
-def get_prefabs_data(project_id, page_name, auth_cookie):
+async def get_prefabs_data(project_id, page_name, auth_cookie):
     prefabs_data_url = f"{origin}/studio/services/projects/{project_id}/pages/{page_name}/prefabs-data"
-    prefabs_data = get_api_response(prefabs_data_url, auth_cookie)
+    prefabs_data = await get_api_response(prefabs_data_url, auth_cookie)
     prefabs_list = []
     if not prefabs_data:
         return prefabs_list
@@ -39,33 +80,195 @@ def get_prefabs_data(project_id, page_name, auth_cookie):
         config = data.get('config', {})
         curr_prefab["properties"] = config.get("properties")
         curr_prefab["methods"] = config.get("methods")
-        events = config.get("events", {})
+        # The config comes from the shared response cache, so extend a copy of its events.
+        events = dict(config.get("events") or {})
         events["onLoad"] = {"description": "triggers on load of prefab"}
         events["onDestroy"] = {"description": "triggers on destroy of prefab"}
         curr_prefab["events"] = events
         prefabs_list.append(curr_prefab)
     return prefabs_list
 
+async def run_blocking(func, *args):
+    """Run CPU-bound work on the bounded parse pool so the event loop keeps serving other clients."""
+    return await asyncio.get_running_loop().run_in_executor(_parse_executor, func, *args)
+
+def content_hash(text):
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
 def decode_variables(encoded_string):
-    decoded = unquote_plus(encoded_string)
-    return json.loads(decoded)
+    """Decoded variables JSON, memoized on the content hash of the encoded string (read-only)."""
+    digest = content_hash(encoded_string)
+    variables_json = _decoded_variables.get(digest)
+    if variables_json is None:
+        decoded = unquote_plus(encoded_string)
+        variables_json = json.loads(decoded)
+        _decoded_variables.set(digest, variables_json)
+    return variables_json
+
+def memo_stats():
+    """Hit/miss counters of the content-hash memo caches."""
+    return {
+        "markup": _parsed_markup.stats(),
+        "decodedVariables": _decoded_variables.stats(),
+        "variables": _resolved_variables.stats()
+    }
+
+async def get_partial_data(project_id, partial_name, auth_cookie):
+    """Fetch and parse one partial without expanding the partials nested in it.
 
-def get_partial_data(project_id, partial_name, auth_cookie):
+    Returns the partial's data and the partial containers found in its markup.
+    """
     partial_name = partial_name.strip()
     partial_url = f"{origin}/studio/services/projects/{project_id}/pages/{partial_name}/page.min.json"
-    partial_data = get_api_response(partial_url, auth_cookie)
+    partial_data = await get_api_response(partial_url, auth_cookie)
     if not partial_data:
-        return {}
-    partial_widgets = extract_widgets_preserving_children(partial_data["markup"], project_id)
-    variables, actions = get_variables(decode_variables(partial_data["variables"]), project_id)
+        return {}, []
+    (partial_widgets, _, nested_partials), (variables, actions) = await asyncio.gather(
+        run_blocking(parse_widgets, partial_data["markup"]),
+        get_encoded_variables(partial_data["variables"], project_id, auth_cookie)
+    )
     return {
         "Widgets": partial_widgets,
         "Variables": variables,
         "Actions": actions
+    }, nested_partials
+
+async def get_encoded_variables(encoded_variables, project_id, auth_cookie):
+    """get_variables for a page's encoded variables blob, memoized on the blob's content hash.
+
+    A memoized result is reused only while the service catalogs it was resolved against are
+    still the cached ones, so it never outlives their TTL or a failed catalog fetch.
+    """
+    variables_json = await run_blocking(decode_variables, encoded_variables)
+    catalogs = await get_service_catalogs(variables_json, project_id, auth_cookie)
+    key = (origin, project_id, content_hash(encoded_variables))
+    memo = _resolved_variables.get(key)
+    if memo is not None and memo[0].keys() == catalogs.keys() and all(memo[0][name] is catalogs[name] for name in catalogs):
+        return memo[1]
+    result = resolve_variables(variables_json, catalogs)
+    _resolved_variables.set(key, (catalogs, result))
+    return result
+
+async def expand_partials(widgets, partial_widgets, project_id, auth_cookie):
+    """Expand the partial containers found by parse_widgets, breadth-first across nesting levels.
+
+    Every distinct partial is fetched and parsed once, concurrently with the rest of its level,
+    and the result is shared by every container that references it. A reference to a partial that
+    is already being expanded on the current path closes a cycle; it is left unexpanded and
+    flagged "cyclic".
+    Returns a copy of `widgets` with the containers expanded.
+    """
+    partials = {}
+    pending = list(partial_widgets)
+    while pending:
+        names = list({tag_info["content"].strip() for tag_info in pending} - partials.keys())
+        results = await asyncio.gather(*(get_partial_data(project_id, name, auth_cookie) for name in names))
+        pending = []
+        for name, (partialdata, nested_partials) in zip(names, results):
+            partials[name] = (partialdata, nested_partials)
+            pending.extend(nested_partials)
+
+    # Parse results are memoized and shared, so expansion builds copies instead of filling them in.
+    # An expansion is kept only if no cycle inside it was cut at one of its callers, and reused only
+    # if none of the partials it contains is on the current path, since both depend on that path.
+    expanded = {}
+    active = set()
+
+    def expand_widgets(widgets, containers, cuts, contained):
+        container_ids = {id(tag_info) for tag_info in containers}
+        if not container_ids:
+            return widgets
+        return {
+            name: expand_container(tag_info, cuts, contained) if id(tag_info) in container_ids else tag_info
+            for name, tag_info in widgets.items()
+        }
+
+    def expand_container(tag_info, cuts, contained):
+        name = tag_info["content"].strip()
+        tag_info = dict(tag_info)
+        if name in active:
+            tag_info["cyclic"] = True
+            cuts.add(name)
+            return tag_info
+        memo = expanded.get(name)
+        if memo is not None and not memo[1] & active:
+            partialdata, own_contained = memo
+        else:
+            partialdata, nested_partials = partials[name]
+            own_cuts, own_contained = set(), set()
+            if partialdata:
+                active.add(name)
+                try:
+                    partialdata = dict(partialdata, Widgets=expand_widgets(partialdata["Widgets"], nested_partials, own_cuts, own_contained))
+                finally:
+                    active.discard(name)
+            own_cuts.discard(name)
+            if own_cuts:
+                cuts |= own_cuts
+            else:
+                expanded[name] = (partialdata, own_contained)
+        contained.add(name)
+        contained |= own_contained
+        tag_info["Widgets"] = partialdata.get("Widgets")
+        tag_info["Variables"] = partialdata.get("Variables")
+        tag_info["Actions"] = partialdata.get("Actions")
+        return tag_info
+
+    return expand_widgets(widgets, partial_widgets, set(), set())
+
+async def get_service_catalog(project_id, service, auth_cookie):
+    """Parameters per operationId and fields per type for a project service, cached per (origin, project, service)."""
+    key = (origin, project_id, service)
+    catalog = _service_catalogs.get(key)
+    if catalog is not None:
+        return catalog
+    scope = studio_client.auth_scope(auth_headers(auth_cookie))
+    return await studio_client.coalesce(("service-catalog", *key, scope), lambda: _build_service_catalog(key, auth_cookie))
+
+async def _build_service_catalog(key, auth_cookie):
+    _, project_id, service = key
+    service_url = f"{origin}/studio/services/projects/{project_id}"
+    # A missing definitions or types file is an empty catalog, not a failure.
+    service_defs, types = await asyncio.gather(
+        get_api_response(f"{service_url}/resources/content/project/services/{service}/src/servicedefs/{service}-service-definitions.json", auth_cookie, missing={}),
+        get_api_response(f"{service_url}/services/{service}/types", auth_cookie, missing={})
+    )
+    catalog = {"operations": {}, "types": {}}
+    for operation_id, definition in (service_defs or {}).items():
+        catalog["operations"][operation_id] = [
+            {"name": parameter["name"], "type": parameter.get("parameterType", parameter.get("type"))}
+            for parameter in definition.get("wmServiceOperationInfo", {}).get("parameters", [])
+        ]
+    if types and "types" in types:
+        for type_name, type_info in types["types"].items():
+            catalog["types"][type_name] = [
+                {"name": field_name, "type": field_info.get("type")}
+                for field_name, field_info in type_info.get("fields", {}).items()
+            ]
+    # A transient failure is retried on the next call instead of being remembered for the whole TTL.
+    if service_defs is not None and types is not None:
+        _service_catalogs.set(key, catalog)
+    return catalog
+
+ACTION_CATEGORIES = {"NavigationVariable", "NotificationVariable", "LogoutVariable", "LoginVariable", "TimerVariable"}
+
+async def get_service_catalogs(variables_json, project_id, auth_cookie):
+    """Catalogs of every distinct service the variables are bound to, keyed by service name."""
+    services = {
+        details["service"] for details in variables_json.values()
+        if details.get("service") and details.get("operationId")
+        and details.get("category", "").replace("wm.", "") not in ACTION_CATEGORIES | {"Variable"}
     }
+    return dict(zip(services, await asyncio.gather(
+        *(get_service_catalog(project_id, service, auth_cookie) for service in services)
+    )))
+
+async def get_variables(variables_json, project_id, auth_cookie):
+    catalogs = await get_service_catalogs(variables_json, project_id, auth_cookie)
+    return resolve_variables(variables_json, catalogs)
 
-def get_variables(variables_json, project_id, auth_cookie):
-    action_categories = {"NavigationVariable", "NotificationVariable", "LogoutVariable", "LoginVariable", "TimerVariable"}
+def resolve_variables(variables_json, catalogs):
+    action_categories = ACTION_CATEGORIES
     variables = {}
     actions = {}
 
@@ -87,29 +290,19 @@ def get_variables(variables_json, project_id, auth_cookie):
             elif category == "TimerVariable" and details.get("delay"):
                 filtered["delay"] = details["delay"]
         elif details.get("service") and details.get("operationId"):
-            service = details["service"]
-            operation_id = details["operationId"]
-            service_defs_url = f"{origin}/studio/services/projects/{project_id}/resources/content/project/services/{service}/src/servicedefs/{service}-service-definitions.json"
-            service_defs = get_api_response(service_defs_url, auth_cookie)
+            catalog = catalogs[details["service"]]
             parameters = []
-            if service_defs and operation_id in service_defs:
-                parameters_set = service_defs[operation_id]["wmServiceOperationInfo"]["parameters"]
-                for parameter in parameters_set:
-                    obj = {"name": parameter["name"]}
-                    obj["type"] = parameter.get("parameterType", parameter.get("type"))
-                    for binding in details.get("dataBinding", []):
-                        if binding.get("target") == parameter["name"]:
-                            obj["value"] = binding.get("value")
-                    parameters.append(obj)
-            types_url = f"{origin}/studio/services/projects/{project_id}/services/{service}/types"
-            types = get_api_response(types_url, auth_cookie)
-            data_set = []
-            if types and "types" in types and details.get("type") in types["types"]:
-                fields = types["types"][details["type"]].get("fields", {})
-                for field_name, field_info in fields.items():
-                    data_set.append({"name": field_name, "type": field_info.get("type")})
+            for parameter in catalog["operations"].get(details["operationId"], []):
+                obj = dict(parameter)
+                for binding in details.get("dataBinding", []):
+                    if binding.get("target") == parameter["name"]:
+                        obj["value"] = binding.get("value")
+                parameters.append(obj)
+            fields = catalog["types"].get(details.get("type"))
+            if fields is not None:
+                data_set = [dict(field) for field in fields]
             else:
-                data_set.append("value")
+                data_set = ["value"]
             filtered["parameters"] = parameters
             filtered["dataSet"] = data_set
         elif category == "LiveVariable":
@@ -125,35 +318,66 @@ def get_variables(variables_json, project_id, auth_cookie):
             actions[name] = filtered
     return variables, actions
 
-def extract_widgets_preserving_children(encoded_markup, project_id, auth_cookie):
+DEFAULT_WIDGETS = [
+    "wm-page", "wm-header", "wm-top-nav", "wm-content", "wm-left-panel",
+    "wm-page-content", "wm-composite", "wm-footer", "wm-gridrow",
+    "wm-gridcolumn", "wm-layoutgrid", "wm-listtemplate", "wm-partial", "wm-dialogactions",
+    "wm-card", "wm-listtemplate", "wm-livetable", "html", "head", "body", "wm-prefab-container"
+]
+PARTIAL_WIDGETS = ["wm-container", "wm-panel", "accordionpane", "wm-tabpane", "wm-card-content", "wm-wizardstep"]
+DATA_WIDGETS = ["wm-list", "wm-card", "wm-table", "wm-form", "wm-liveform"]
+CHILD_WIDGETS = ["wm-form-field", "wm-table-column", "wm-param"]
+
+# "stream" (default) walks the markup once; "bs4" uses the original BeautifulSoup implementation.
+WIDGET_PARSER = os.environ.get("WIDGET_PARSER", "stream")
+
+class WidgetExtraction(NamedTuple):
+    """Result of one extraction call, so concurrent extractions never share state."""
+    widgets: dict
+    page_type: str | None
+    partial_widgets: list
+
+def parse_widgets(encoded_markup):
+    """CPU-bound half of widget extraction; the partial containers it finds are still unexpanded.
+
+    Results are memoized on the markup's content hash and shared between callers, so they
+    must be treated as read-only.
+    """
+    digest = content_hash(encoded_markup)
+    extraction = _parsed_markup.get(digest)
+    if extraction is None:
+        extraction = _parse_widgets(encoded_markup)
+        _parsed_markup.set(digest, extraction)
+    return extraction
+
+def _parse_widgets(encoded_markup):
+    if WIDGET_PARSER == "bs4":
+        return parse_widgets_bs4(encoded_markup)
+    parser = WidgetStreamParser()
+    parser.feed(unquote_plus(encoded_markup.replace("+", " ")))
+    parser.close()
+    return WidgetExtraction(parser.tag_data, parser.page_type, parser.partial_widgets)
+
+def parse_widgets_bs4(encoded_markup):
+    """Reference implementation of parse_widgets on a full BeautifulSoup tree."""
     decoded_str = unquote_plus(encoded_markup.replace("+", " "))
     soup = BeautifulSoup(decoded_str, "html.parser")
     tag_data = {}
-
-    DEFAULT_WIDGETS = [
-        "wm-page", "wm-header", "wm-top-nav", "wm-content", "wm-left-panel",
-        "wm-page-content", "wm-composite", "wm-footer", "wm-gridrow",
-        "wm-gridcolumn", "wm-layoutgrid", "wm-listtemplate", "wm-partial", "wm-dialogactions",
-        "wm-card", "wm-listtemplate", "wm-livetable", "html", "head", "body", "wm-prefab-container"
-    ]
-    PARTIAL_WIDGETS = ["wm-container", "wm-panel", "accordionpane", "wm-tabpane", "wm-card-content", "wm-wizardstep"]
-    DATA_WIDGETS = ["wm-list", "wm-card", "wm-table", "wm-form", "wm-liveform"]
-    CHILD_WIDGETS = ["wm-form-field", "wm-table-column", "wm-param"]
     list_item_widgets = []
+    partial_widgets = []
 
     tags = soup.find_all(True)
-    global PageType
-    PageType = None
+    page_type = None
     if tags and len(tags) > 3:
         tag_name = tags[3].name.lower()
         if tag_name == "wm-page":
-            PageType = "Page"
+            page_type = "Page"
         elif tag_name == "wm-partial":
-            PageType = "Partial"
+            page_type = "Partial"
         elif tag_name == "wm-prefab-container":
-            PageType = "Prefab"
+            page_type = "Prefab"
         else:
-            PageType = "Page"
+            page_type = "Page"
 
     for tag in tags:
         tag_name_lower = tag.name.lower()
@@ -188,10 +412,9 @@ def extract_widgets_preserving_children(encoded_markup, project_id, auth_cookie)
             tag_info["type"] = "partial"
             tag_info["partialParams"] = params
             tag_info["content"] = partial_name
-            partialdata = get_partial_data(project_id, partial_name, auth_cookie)
-            tag_info["Widgets"] = partialdata.get("Widgets")
-            tag_info["Variables"] = partialdata.get("Variables")
-            tag_info["Actions"] = partialdata.get("Actions")
+            # Filled in once the partial has been fetched; set here to keep the key order.
+            tag_info["Widgets"] = tag_info["Variables"] = tag_info["Actions"] = None
+            partial_widgets.append(tag_info)
         elif tag_name_lower == "wm-container":
             continue
 
@@ -232,56 +455,341 @@ def extract_widgets_preserving_children(encoded_markup, project_id, auth_cookie)
                 else:
                     tag_info["children"] = children
         tag_data[name] = tag_info
-    return tag_data
+    return WidgetExtraction(tag_data, page_type, partial_widgets)
+
+# Tags that BeautifulSoup's html.parser builder closes as soon as they open.
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "keygen", "link", "menuitem", "meta",
+    "param", "source", "track", "wbr", "basefont", "bgsound", "command", "frame", "image", "isindex",
+    "nextid", "spacer"
+}
+PAGE_TYPES = {"wm-page": "Page", "wm-partial": "Partial", "wm-prefab-container": "Prefab"}
+FORM_WIDGETS = {"wm-form", "wm-liveform"}
+
+class WidgetStreamParser(HTMLParser):
+    """Single pass over the markup's tag events, producing the same result as parse_widgets_bs4.
+
+    Instead of a document tree it keeps the stack of open tags (nested the way BeautifulSoup
+    would nest them) and the data widgets / partial containers that are still open, which
+    receive each descendant as it starts.
+    """
 
-def get_app_context(project_id, page_name, auth_cookie):
+    def __init__(self):
+        super().__init__()
+        self.tag_data = {}
+        self.page_type = None
+        self.partial_widgets = []
+        self._tag_count = 0
+        self._list_item_widgets = set()
+        self._open_tags = []
+        self._open_counts = {}
+        self._collectors = []
+        self._closed_void_tags = []
+
+    def handle_starttag(self, tag, attrs):
+        self._open(tag, attrs)
+        if tag in VOID_TAGS:
+            self._close(tag)
+            self._closed_void_tags.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        # <tag/> closes itself; like BeautifulSoup, this does not use up an earlier void tag's
+        # pending end tag.
+        self._open(tag, attrs)
+        self._close(tag)
+
+    def handle_endtag(self, tag):
+        if tag in self._closed_void_tags:
+            self._closed_void_tags.remove(tag)
+        else:
+            self._close(tag)
+
+    def _open(self, tag, attrs):
+        attributes = {}
+        for attr, value in attrs:
+            attributes[attr] = "" if value is None else value
+        self._tag_count += 1
+        if self._tag_count == 4:
+            self.page_type = PAGE_TYPES.get(tag, "Page")
+        for collector in self._collectors:
+            self._add_descendant(collector, tag, attributes)
+        collector = self._add_widget(tag, attributes)
+        self._open_tags.append((tag, collector))
+        self._open_counts[tag] = self._open_counts.get(tag, 0) + 1
+        if collector:
+            self._collectors.append(collector)
+
+    def _close(self, tag):
+        if not self._open_counts.get(tag):
+            return
+        while self._open_tags:
+            name, collector = self._open_tags.pop()
+            self._open_counts[name] -= 1
+            if collector:
+                self._collectors.pop()
+            if name == tag:
+                break
+
+    def _add_widget(self, tag, attributes):
+        name = attributes.get("name")
+        if tag in DEFAULT_WIDGETS or tag in CHILD_WIDGETS or name in self._list_item_widgets or not name:
+            return None
+        tag_info = {"category": tag.replace("wm-", "")}
+        for attr in ("dataset", "caption", "datafield", "type", "iconclass"):
+            if attr in attributes:
+                tag_info[attr] = attributes[attr]
+        for attr, value in attributes.items():
+            if attr.startswith("on-"):
+                tag_info[attr] = value
+
+        collector = None
+        if tag in PARTIAL_WIDGETS and "content" in attributes:
+            params = []
+            tag_info["type"] = "partial"
+            tag_info["partialParams"] = params
+            tag_info["content"] = attributes["content"]
+            tag_info["Widgets"] = tag_info["Variables"] = tag_info["Actions"] = None
+            self.partial_widgets.append(tag_info)
+            collector = (tag, tag_info, params)
+        elif tag == "wm-container":
+            return None
+
+        if tag in DATA_WIDGETS:
+            collector = (tag, tag_info, {})
+        self.tag_data[name] = tag_info
+        return collector
+
+    def _add_descendant(self, collector, child_tag, attributes):
+        tag, tag_info, children = collector
+        if tag not in DATA_WIDGETS:
+            if child_tag == "wm-param":
+                children.append({"name": attributes.get("name"), "type": attributes.get("type")})
+            return
+        child_name = attributes.get("name") or attributes.get("caption")
+        if not child_name or child_tag in DEFAULT_WIDGETS:
+            return
+        if tag == "wm-table" and child_tag != "wm-table-column":
+            return
+        child_widget = {"category": child_tag.replace("wm-", "")}
+        if "caption" in attributes:
+            child_widget["caption"] = attributes["caption"]
+        if "widget" in attributes:
+            child_widget["widget"] = attributes["widget"]
+        elif "type" in attributes:
+            child_widget["type"] = attributes["type"]
+        if tag not in FORM_WIDGETS and tag != "wm-table":
+            self._list_item_widgets.add(child_name)
+        if not children:
+            if tag in FORM_WIDGETS:
+                tag_info["formWidgets"] = children
+            elif tag == "wm-list":
+                tag_info["list-item-widgets"] = children
+            elif tag == "wm-table":
+                tag_info["table-columns"] = children
+            else:
+                tag_info["children"] = children
+        children[child_name] = child_widget
+
+async def extract_widgets_preserving_children(encoded_markup, project_id, auth_cookie):
+    extraction = await run_blocking(parse_widgets, encoded_markup)
+    widgets = await expand_partials(extraction.widgets, extraction.partial_widgets, project_id, auth_cookie)
+    return extraction._replace(widgets=widgets)
+
+def _app_context_key(project_id, auth_cookie):
+    scope = studio_client.auth_scope(auth_headers(auth_cookie))
+    return (origin, project_id, scope, _app_context_generations.get((origin, project_id), 0))
+
+def invalidate_app_context(project_id):
+    """Drop the cached App block of `project_id` for every auth scope."""
+    key = (origin, project_id.strip())
+    _app_context_generations[key] = _app_context_generations.get(key, 0) + 1
+
+async def get_app_block(project_id, auth_cookie, refresh=False):
+    """The App block of a project (Common page widgets and app variables), or None if it has none.
+
+    Cached per project and auth scope. After APP_CONTEXT_FRESH seconds the Common page and app
+    variables are fetched again (a 304 when Studio sends validators) and the cached block is
+    reused if both bodies still hash to the ones it was built from. While either fetch fails,
+    the cached block is served. `refresh` rebuilds it and forgets recent failures of both resources.
+    The result is shared between requests and must be treated as read-only.
+    """
     project_id = project_id.strip()
-    page_name = page_name.strip()
-    global PageType
-    PageType = ""
-    page_data_url = f"{origin}/studio/services/projects/{project_id}/pages/{page_name}/page.min.json"
-    page_data = get_api_response(page_data_url, auth_cookie)
-    if not page_data:
-        return {"appContext": {}, "projectName": "null"}
-    widgets = extract_widgets_preserving_children(page_data["markup"], project_id, auth_cookie)
-    variables, actions = get_variables(decode_variables(page_data["variables"]), project_id, auth_cookie)
-    app_context = {
-        PageType: {
-            "Widgets": widgets,
-            "Variables": variables,
-            "Actions": actions
-        }
+    if refresh:
+        invalidate_app_context(project_id)
+        project_url = f"{origin}/studio/services/projects/{project_id}"
+        studio_client.forget_failure(f"{project_url}/pages/Common/page.min.json")
+        studio_client.forget_failure(f"{project_url}/variables")
+    key = _app_context_key(project_id, auth_cookie)
+    cached = _app_contexts.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[3]
+    return await studio_client.coalesce(("app-block", *key), lambda: _build_app_block(key, auth_cookie))
+
+async def _build_app_block(key, auth_cookie):
+    project_id = key[1]
+    project_url = f"{origin}/studio/services/projects/{project_id}"
+    app_data, app_variables = await asyncio.gather(
+        get_api_response(f"{project_url}/pages/Common/page.min.json", auth_cookie, missing={}),
+        get_api_response(f"{project_url}/variables", auth_cookie, missing={})
+    )
+    cached = _app_contexts.get(key)
+    if app_data is None or app_variables is None:
+        return cached[3] if cached is not None else None
+    fresh_until = time.monotonic() + APP_CONTEXT_FRESH
+    hashes = (content_hash(json.dumps(app_data, sort_keys=True)), content_hash(json.dumps(app_variables, sort_keys=True)))
+    if cached is not None and cached[1:3] == hashes:
+        _app_contexts.set(key, (fresh_until, *cached[1:]))
+        return cached[3]
+    app_block = await _assemble_app_block(project_id, app_data, app_variables, auth_cookie)
+    _app_contexts.set(key, (fresh_until, *hashes, app_block))
+    return app_block
+
+async def _assemble_app_block(project_id, app_data, app_variables, auth_cookie):
+    if not (app_data and app_variables):
+        return None
+    (common_widgets, _, _), (app_vars, app_acts) = await asyncio.gather(
+        extract_widgets_preserving_children(app_data["markup"], project_id, auth_cookie),
+        get_variables(app_variables, project_id, auth_cookie)
+    )
+    if not common_widgets:
+        return None
+    return {
+        "Widgets": common_widgets,
+        "Variables": app_vars,
+        "Actions": app_acts
     }
-    if PageType != "Prefab":
-        common_page_url = f"{origin}/studio/services/projects/{project_id}/pages/Common/page.min.json"
-        app_variables_url = f"{origin}/studio/services/projects/{project_id}/variables"
-        app_data = get_api_response(common_page_url, auth_cookie)
-        if app_data:
-            common_widgets = extract_widgets_preserving_children(app_data["markup"], project_id, auth_cookie)
-            app_variables = get_api_response(app_variables_url, auth_cookie)
-            if app_variables and common_widgets:
-                app_vars, app_acts = get_variables(app_variables, project_id, auth_cookie)
-                app_context["App"] = {
-                    "Widgets": common_widgets,
-                    "Variables": app_vars,
-                    "Actions": app_acts
-                }
-    else:
-        config_url = f"{origin}/studio/services/projects/{project_id}/resources/content/web/config.json"
-        configuration = get_api_response(config_url, auth_cookie)
-        app_context["configuration"] = {
-            "Properties": configuration.get("properties"),
-            "Methods": configuration.get("methods"),
-            "Events": configuration.get("events")
+
+async def get_app_context(project_id, page_name, auth_cookie, include_app=True):
+    project_id = project_id.strip()
+    page_name = page_name.strip()
+    project_url = f"{origin}/studio/services/projects/{project_id}"
+    async with asyncio.TaskGroup() as fetches:
+        # None of these depend on each other; only the page type decides which ones get used,
+        # so start them all together and cancel the unused ones once the page is parsed.
+        page_fetch = fetches.create_task(get_api_response(f"{project_url}/pages/{page_name}/page.min.json", auth_cookie))
+        app_fetch = fetches.create_task(get_app_block(project_id, auth_cookie)) if include_app else None
+        config_fetch = fetches.create_task(get_api_response(f"{project_url}/resources/content/web/config.json", auth_cookie))
+        metadata_fetch = fetches.create_task(get_project_metadata(project_id, auth_cookie))
+        prefabs_fetch = fetches.create_task(get_prefabs_data(project_id, page_name, auth_cookie))
+
+        page_data = await page_fetch
+        if not page_data:
+            for fetch in (app_fetch, config_fetch, metadata_fetch, prefabs_fetch):
+                if fetch:
+                    fetch.cancel()
+            return {"appContext": {}, "projectName": "null"}
+        (widgets, page_type, _), (variables, actions) = await asyncio.gather(
+            extract_widgets_preserving_children(page_data["markup"], project_id, auth_cookie),
+            get_encoded_variables(page_data["variables"], project_id, auth_cookie)
+        )
+        app_context = {
+            page_type: {
+                "Widgets": widgets,
+                "Variables": variables,
+                "Actions": actions
+            }
         }
-    project_details = get_project_metadata(project_id, auth_cookie)
-    project_details["pageName"] = page_name
-    project_details["pageType"] = PageType
-    app_context["metaData"] = project_details
-    prefabs = get_prefabs_data(project_id, page_name, auth_cookie)
-    if prefabs:
-        app_context["prefabs"] = prefabs
+        if page_type != "Prefab":
+            config_fetch.cancel()
+            app_block = await app_fetch if app_fetch else None
+            if app_block:
+                app_context["App"] = app_block
+        else:
+            if app_fetch:
+                app_fetch.cancel()
+            configuration = await config_fetch or {}
+            app_context["configuration"] = {
+                "Properties": configuration.get("properties"),
+                "Methods": configuration.get("methods"),
+                "Events": configuration.get("events")
+            }
+        project_details = await metadata_fetch
+        project_details["pageName"] = page_name
+        project_details["pageType"] = page_type
+        app_context["metaData"] = project_details
+        prefabs = await prefabs_fetch
+        if prefabs:
+            app_context["prefabs"] = prefabs
     return {"appContext": app_context, "projectDetails": project_details}
 
-def build_llm_context(project_id, page_name, auth_cookie):
-    return json.dumps(get_app_context(project_id, page_name, auth_cookie))  # <-- serialize to JSON
+async def build_llm_context(project_id, page_name, auth_cookie, max_tokens=None, include_app=True):
+    studio_client.start_retry_budget()
+    app_context = await get_app_context(project_id, page_name, auth_cookie, include_app)
+    if max_tokens is not None:
+        return await run_blocking(serialize_within_budget, app_context, max_tokens)
+    return await run_blocking(json.dumps, app_context)  # <-- serialize to JSON
+
+async def build_app_block(project_id, auth_cookie, refresh=False):
+    """The project's App block as JSON: {"App": {...}}, or {"App": null} if the project has none."""
+    studio_client.start_retry_budget()
+    app_block = await get_app_block(project_id, auth_cookie, refresh)
+    return await run_blocking(json.dumps, {"App": app_block})
+
+def serialize_within_budget(context, max_tokens, table=None, lookup_parts=None):
+    """JSON of `context` (plus a knowledge lookup from `table`, if given) trimmed to `max_tokens`, with a "budget" report."""
+    fragments, *lookup = lookup_parts or ([],)
+    context, fragments, elided, _ = budget.fit_to_budget(context, fragments, max_tokens, table, lookup or None)
+    context_json = json.dumps(context)
+    if lookup_parts is not None:
+        knowledge = knowledge_store.format_lookup(fragments, *lookup)
+        context_json = context_json[:-1] + "," + ",".join(knowledge) + "}"
+    return budget.add_budget_report(context_json, max_tokens, elided)
+
+def knowledge_platform(project_type):
+    """Knowledge platform ("web" or "mobile") for a project's platformType."""
+    return "mobile" if "MOBILE" in str(project_type or "").upper() else "web"
+
+# Categories that only mark where a partial is placed and have no knowledge entry of their own.
+STRUCTURAL_CATEGORIES = {"container"}
+WIDGET_CHILDREN = ("formWidgets", "table-columns", "list-item-widgets", "children")
+
+def collect_categories(app_context):
+    """Widget, variable and action categories used in the page, its partials and the App block, in order.
+
+    Only the category of each widget (and of its form fields, table columns and list items) and
+    each variable's or action's own category are collected; variable data such as dataSet is
+    never searched.
+    """
+    categories = {}
+
+    def add(category):
+        if isinstance(category, str) and category not in STRUCTURAL_CATEGORIES:
+            categories[category] = None
+
+    pending = [value for section, value in app_context.items() if section not in ("metaData", "prefabs", "configuration")]
+    while pending:
+        block = pending.pop(0)
+        for widget in (block.get("Widgets") or {}).values():
+            add(widget.get("category"))
+            for children in WIDGET_CHILDREN:
+                for child in (widget.get(children) or {}).values():
+                    add(child.get("category"))
+            if "Widgets" in widget:
+                # A partial container, carrying the partial's own widgets, variables and actions.
+                pending.append(widget)
+        for section in ("Variables", "Actions"):
+            for details in (block.get(section) or {}).values():
+                add(details.get("category"))
+    return list(categories)
+
+async def build_llm_context_with_knowledge(project_id, page_name, auth_cookie, max_tokens=None, known_hashes=None, include_app=True):
+    """The page context plus the knowledge entries of every category it uses, as one JSON object.
+
+    Entries whose hash is in `known_hashes` are listed as unchanged instead of being sent again.
+    """
+    studio_client.start_retry_budget()
+    context = await get_app_context(project_id, page_name, auth_cookie, include_app)
+    if "projectDetails" not in context:
+        if max_tokens is not None:
+            return await run_blocking(serialize_within_budget, context, max_tokens)
+        return await run_blocking(json.dumps, context)
+    platform = knowledge_platform(context["projectDetails"].get("projectType"))
+    categories = collect_categories(context["appContext"])
+    if max_tokens is not None:
+        snapshot = knowledge_store.current()
+        lookup_parts = snapshot.lookup_parts(platform, categories, known_hashes=known_hashes)
+        table = snapshot.table(platform)
+        return await run_blocking(serialize_within_budget, context, max_tokens, table, lookup_parts)
+    context_json = await run_blocking(json.dumps, context)
+    knowledge = knowledge_store.lookup_members(platform, categories, known_hashes=known_hashes)
+    return context_json[:-1] + "," + ",".join(knowledge) + "}"
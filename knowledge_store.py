@@ -0,0 +1,687 @@
+import hashlib
+import heapq
+import json
+import math
+import re
+import sys
+import threading
+from pathlib import Path
+
+# Knowledge is layered: knowledge/base.json holds the sections web and mobile share, and
+# knowledge/<platform>.json lists every key of that platform, in order, with only the sections
+# that differ from (or are missing in) the base. manifest.json records the sha256 of each
+# file, which is checked on load so a truncated or hand-edited file is never served silently.
+KNOWLEDGE_DIR = Path(__file__).with_name("knowledge")
+MANIFEST_FILE = "manifest.json"
+BASE_LAYER = "base"
+PLATFORMS = ("web", "mobile")
+
+# The knowledge version requests are served from; reload() replaces it as a whole.
+_snapshot = None
+_swap_lock = threading.Lock()
+
+
+class KnowledgeIntegrityError(Exception):
+    pass
+
+
+class UnknownPlatformError(ValueError):
+    """Raised for a platform other than those in PLATFORMS."""
+
+    def __init__(self, platform):
+        super().__init__(f"unknown knowledge platform {platform!r}; expected one of {', '.join(PLATFORMS)}")
+        self.platform = platform
+
+
+def _read_manifest():
+    return json.loads((KNOWLEDGE_DIR / MANIFEST_FILE).read_text(encoding="utf-8"))
+
+
+def load_layer(name, pool, manifest=None):
+    """Read and verify one knowledge file from disk, with its values interned."""
+    entry = (manifest or _read_manifest())[name]
+    data = (KNOWLEDGE_DIR / entry["file"]).read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    if digest != entry["sha256"]:
+        raise KnowledgeIntegrityError(
+            f"{entry['file']} does not match its manifest hash (expected {entry['sha256']}, got {digest})"
+        )
+    return intern_value(json.loads(data), pool)
+
+
+def load_layers(pool):
+    """Read and verify every knowledge file against a single read of the manifest."""
+    manifest = _read_manifest()
+    return {name: load_layer(name, pool, manifest) for name in (BASE_LAYER, *PLATFORMS)}
+
+
+def intern_value(value, pool):
+    """Return the canonical instance of `value` from `pool`, interning its children first.
+
+    Children are canonical by the time a list or dict is looked up, so their ids identify
+    their content. Interned values are shared and must not be modified.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        items = [intern_value(item, pool) for item in value]
+        return pool.setdefault(("list", *map(id, items)), items)
+    if isinstance(value, dict):
+        items = {sys.intern(key): intern_value(item, pool) for key, item in value.items()}
+        return pool.setdefault(("dict", *((key, id(item)) for key, item in items.items())), items)
+    return value
+
+
+def resolve_layers(base, overrides):
+    """Platform table from the shared base and that platform's overrides (None drops a section)."""
+    table = {}
+    for key, override in overrides.items():
+        entry = dict(base.get(key, {}))
+        for section, value in override.items():
+            if value is None:
+                entry.pop(section, None)
+            else:
+                entry[section] = value
+        table[key] = entry
+    return table
+
+
+def canonical_json(value):
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def compile_knowledge(table):
+    """Serialize each entry once as a ready-to-send `"key":{...}` JSON member.
+
+    Entries are written as canonical compact JSON (sorted keys, no whitespace).
+    """
+    return {key: sys.intern(canonical_json(key) + ":" + canonical_json(entry)) for key, entry in table.items()}
+
+
+def compile_projections(table):
+    """Per-section and per-member fragments of every entry, for projected lookups.
+
+    For each key: "sections" maps section -> `"section":...` member (in canonical order) and
+    "members" maps list sections to (group, lower-cased member name, item fragment) tuples;
+    group is set for sections grouped by format, such as the variable events.
+    """
+    projections = {}
+    for key, entry in table.items():
+        sections = {}
+        members = {}
+        for section in sorted(entry):
+            value = entry[section]
+            sections[section] = sys.intern(canonical_json(section) + ":" + canonical_json(value))
+            if isinstance(value, list):
+                grouped = [(None, item) for item in value]
+            elif isinstance(value, dict) and all(isinstance(items, list) for items in value.values()):
+                grouped = [(group, item) for group in sorted(value) for item in value[group]]
+            else:
+                continue
+            members[section] = [
+                (group, _member_name(item).lower(), sys.intern(canonical_json(item)))
+                for group, item in grouped if _member_name(item)
+            ]
+        projections[key] = {"sections": sections, "members": members}
+    return projections
+
+
+def _member_name(item):
+    if isinstance(item, dict):
+        return str(item.get("name", ""))
+    if isinstance(item, str):
+        return _event_name(item) or ""
+    return ""
+
+
+def project_fragments(projections, keys, sections=None, members=None):
+    """(key, `"key":{...}` member) pairs holding only the requested sections / members of each key.
+
+    Returns (pairs, unmatched), where unmatched lists the requested "sections" and "members"
+    found in none of the keys (each present only when non-empty).
+    """
+    requested_sections, requested_members = sections, members
+    sections = None if sections is None else set(sections)
+    members = None if members is None else {member.lower() for member in members}
+    matched_sections = set()
+    matched_members = set()
+    parts = []
+    for key in dict.fromkeys(keys):
+        projection = projections[key]
+        selected = []
+        for section, fragment in projection["sections"].items():
+            if sections is not None and section not in sections:
+                continue
+            matched_sections.add(section)
+            if members is None:
+                selected.append(fragment)
+                continue
+            items = []
+            for group, name, item in projection["members"].get(section, ()):
+                if name in members:
+                    matched_members.add(name)
+                    items.append((group, item))
+            if not items:
+                continue
+            if items[0][0] is None:
+                selected.append(canonical_json(section) + ":[" + ",".join(item for _, item in items) + "]")
+            else:
+                groups = {}
+                for group, item in items:
+                    groups.setdefault(group, []).append(item)
+                selected.append(canonical_json(section) + ":{" + ",".join(
+                    canonical_json(group) + ":[" + ",".join(group_items) + "]" for group, group_items in groups.items()
+                ) + "}")
+        parts.append((key, canonical_json(key) + ":{" + ",".join(selected) + "}"))
+    unmatched = {}
+    if requested_sections is not None:
+        missing = [section for section in dict.fromkeys(requested_sections) if section not in matched_sections]
+        if missing:
+            unmatched["sections"] = missing
+    if requested_members is not None:
+        missing = [member for member in dict.fromkeys(requested_members) if member.lower() not in matched_members]
+        if missing:
+            unmatched["members"] = missing
+    return parts, unmatched
+
+
+# Names that do not normalize to their knowledge key, such as the categories extracted from
+# <wm-dialog> or <wm-liveform>.
+KEY_ALIASES = {"dialog": "designdialog", "liveform": "form", "livetable": "table"}
+# Near-matches are keys sharing enough trigrams (Dice coefficient) with the requested name and
+# within a few edits of it, so "tble" finds "table" but "DeviceVariable" does not become
+# "wm.ServiceVariable" on web.
+NEAR_MATCH_THRESHOLD = 0.5
+NEAR_MATCH_CHARS_PER_EDIT = 8
+
+_KEY_PREFIXES = ("wm.", "wm-")
+_NOT_KEY_CHAR = re.compile(r"[^a-z0-9]")
+
+
+def normalize_key(name):
+    """Case-folded `name` without a wm. / wm- prefix or separators (wm-form-field -> formfield)."""
+    name = name.strip().lower()
+    for prefix in _KEY_PREFIXES:
+        if name.startswith(prefix):
+            name = name[len(prefix):]
+    return _NOT_KEY_CHAR.sub("", name)
+
+
+def _trigrams(name):
+    padded = f"  {name} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class KeyResolver:
+    """Maps the names clients ask for onto the knowledge keys of one platform.
+
+    Exact keys are used as-is; other names are normalized and looked up in a precomputed alias
+    table, and failing that matched to the key sharing the most trigrams.
+    """
+
+    def __init__(self, keys):
+        self.keys = frozenset(keys)
+        self.aliases = {normalize_key(key): key for key in keys}
+        for alias, key in KEY_ALIASES.items():
+            if key in self.keys:
+                self.aliases.setdefault(alias, key)
+        self.trigram_counts = {}
+        self.postings = {}
+        for name, key in self.aliases.items():
+            if normalize_key(key) != name:
+                continue
+            grams = _trigrams(name)
+            self.trigram_counts[key] = len(grams)
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(key)
+
+    def resolve(self, name):
+        """The knowledge key `name` refers to, or None."""
+        if name in self.keys:
+            return name
+        normalized = normalize_key(name)
+        key = self.aliases.get(normalized)
+        if key is None and normalized:
+            key = self._nearest(normalized)
+        return key
+
+    def _nearest(self, name):
+        grams = _trigrams(name)
+        shared = {}
+        for gram in grams:
+            for key in self.postings.get(gram, ()):
+                shared[key] = shared.get(key, 0) + 1
+        max_edits = max(1, len(name) // NEAR_MATCH_CHARS_PER_EDIT)
+        candidates = []
+        for key, count in shared.items():
+            if 2 * count / (len(grams) + self.trigram_counts[key]) >= NEAR_MATCH_THRESHOLD:
+                edits = edit_distance(name, normalize_key(key))
+                if edits <= max_edits:
+                    candidates.append((edits, key))
+        return min(candidates)[1] if candidates else None
+
+
+def edit_distance(a, b):
+    """Edits (insert, delete, substitute, swap adjacent) turning `a` into `b`."""
+    previous, current = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        before, previous, current = previous, current, [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a[i - 1] != b[j - 1]))
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], before[j - 2] + 1)
+    return current[-1]
+
+
+def fragment_hash(fragment):
+    """Short content hash of a knowledge fragment, which clients send back to skip unchanged keys."""
+    return hashlib.blake2b(fragment.encode(), digest_size=8).hexdigest()
+
+
+def split_unchanged(fragments, known_hashes):
+    """Separate the fragments whose hash the client already holds: (changed pairs, unchanged keys)."""
+    if not known_hashes:
+        return fragments, []
+    changed = []
+    unchanged = []
+    for key, fragment in fragments:
+        if known_hashes.get(key) == fragment_hash(fragment):
+            unchanged.append(key)
+        else:
+            changed.append((key, fragment))
+    return changed, unchanged
+
+
+def format_lookup(fragments, resolved, unresolved, unchanged=(), unmatched=None):
+    """The "knowledge" / "hashes" / "unchanged" / "resolved" / "unresolved" / "unmatched" JSON members of a lookup."""
+    parts = [
+        '"knowledge":{' + ",".join(fragment for _, fragment in fragments) + "}",
+        '"hashes":' + canonical_json({key: fragment_hash(fragment) for key, fragment in fragments}),
+    ]
+    if unchanged:
+        parts.append('"unchanged":' + canonical_json(unchanged))
+    if resolved:
+        parts.append('"resolved":' + canonical_json(resolved))
+    if unresolved:
+        parts.append('"unresolved":' + canonical_json(unresolved))
+    if unmatched:
+        parts.append('"unmatched":' + canonical_json(unmatched))
+    return parts
+
+_WORD = re.compile(r"[A-Za-z0-9]+")
+_CAMEL_PART = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+")
+# Handler name in event strings such as "<scope>.[WidgetName]Select = function(...)"
+# or "\"onResult\" : \"<variableName>onResult(...)\"".
+_EVENT_NAME = re.compile(r'[\]>](\w+)\s*=\s*function|^"(\w+)"\s*:')
+
+# Relative weight of where a term occurs inside an indexed sub-entry.
+NAME_WEIGHT = 3.0
+SYNTAX_WEIGHT = 2.0
+TEXT_WEIGHT = 1.0
+
+
+def tokenize(text):
+    """Lower-cased words of `text`; camelCase words also yield their parts (deselectItem -> deselect, item)."""
+    for word in _WORD.findall(text):
+        yield word.lower()
+        parts = _CAMEL_PART.findall(word)
+        if len(parts) > 1:
+            for part in parts:
+                yield part.lower()
+
+
+def _event_name(text):
+    match = _EVENT_NAME.search(text)
+    return match and (match.group(1) or match.group(2))
+
+
+def _text(value):
+    return value if isinstance(value, str) else json.dumps(value, ensure_ascii=False)
+
+
+def _sub_entries(key, entry):
+    """Yield (path, section, weighted fields, value) for every searchable part of an entry."""
+    yield key, None, [(key, NAME_WEIGHT), (entry.get("name", ""), NAME_WEIGHT)], {"name": key, "sections": sorted(entry)}
+    for section in sorted(entry):
+        value = entry[section]
+        if section == "name":
+            continue
+        if isinstance(value, dict) and all(isinstance(item, list) for item in value.values()):
+            items = [(f"{section}.{group}", item) for group, group_items in value.items() for item in group_items]
+        elif isinstance(value, list):
+            items = [(section, item) for item in value]
+        else:
+            yield f"{key}.{section}", section, [(section, SYNTAX_WEIGHT), (_text(value), TEXT_WEIGHT)], value
+            continue
+        for position, (item_section, item) in enumerate(items):
+            if isinstance(item, dict) and "name" in item:
+                name = str(item["name"])
+                fields = [(name, NAME_WEIGHT), (str(item.get("syntax", "")), SYNTAX_WEIGHT)]
+                fields.append((_text({k: v for k, v in item.items() if k not in ("name", "syntax")}), TEXT_WEIGHT))
+            elif isinstance(item, str) and _event_name(item):
+                name = _event_name(item)
+                fields = [(name, NAME_WEIGHT), (item, TEXT_WEIGHT)]
+            else:
+                name = f"{section}[{position}]"
+                fields = [(section, SYNTAX_WEIGHT), (_text(item), TEXT_WEIGHT)]
+            yield f"{key}.{name}", item_section, fields, item
+
+
+class KnowledgeIndex:
+    """Inverted index over widget names, member names, syntax strings and descriptions.
+
+    Postings hold precomputed tf-idf weights and every hit has a precompiled JSON fragment,
+    so a query is a handful of dictionary lookups plus a join.
+    """
+
+    def __init__(self, table):
+        self.hits = []
+        term_weights = []
+        for key, entry in table.items():
+            for path, section, fields, value in _sub_entries(key, entry):
+                weights = {}
+                for text, weight in fields:
+                    for term in tokenize(text):
+                        weights[term] = weights.get(term, 0.0) + weight
+                term_weights.append(weights)
+                self.hits.append(sys.intern(canonical_json({"path": path, "section": section, "entry": value})))
+        document_frequency = {}
+        for weights in term_weights:
+            for term in weights:
+                document_frequency[term] = document_frequency.get(term, 0) + 1
+        total = len(term_weights)
+        self.postings = {}
+        for hit, weights in enumerate(term_weights):
+            for term, weight in weights.items():
+                idf = math.log(1 + total / document_frequency[term])
+                self.postings.setdefault(term, []).append((hit, (1 + math.log(weight)) * idf))
+
+    def search(self, query, limit=10):
+        """Ranked hits for `query` as a JSON array string."""
+        scores = {}
+        for term in set(tokenize(query)):
+            for hit, score in self.postings.get(term, ()):
+                scores[hit] = scores.get(hit, 0.0) + score
+        best = heapq.nlargest(limit, scores, key=lambda hit: (scores[hit], -hit))
+        return "[" + ",".join(self.hits[hit] for hit in best) + "]"
+
+
+_EVENT_LABEL = re.compile(r"\s*//\s*(Examples?|Explanation)\s*:\s*")
+_EVENT_PARAMS = re.compile(r"\(([^)]*)\)")
+
+
+def event_signature(text):
+    """An event string without its "// Example:" and "// Explanation:" parts; other strings unchanged."""
+    label = _EVENT_LABEL.search(text)
+    return text[:label.start()].rstrip() if label else text
+
+
+class EventRecord:
+    """One event of a widget or variable, parsed from its knowledge string.
+
+    The strings read "<signature>; // Example: <code> // Explanation: <text>", with the
+    example and explanation optional; `group` is the format group for variable events.
+    """
+
+    __slots__ = ("event", "group", "handler", "params", "example", "explanation")
+
+    def __init__(self, event, group, handler, params, example=None, explanation=None):
+        self.event = event
+        self.group = group
+        self.handler = handler
+        self.params = params
+        self.example = example
+        self.explanation = explanation
+
+    @classmethod
+    def parse(cls, text, group=None):
+        """The record of one event string, or None if no handler name is found in it."""
+        event = _event_name(text)
+        if not event:
+            return None
+        parts = _EVENT_LABEL.split(text)
+        handler = parts[0].strip()
+        labelled = {}
+        for label, value in zip(parts[1::2], parts[2::2]):
+            labelled["explanation" if label == "Explanation" else "example"] = value.strip()
+        params = _EVENT_PARAMS.search(handler)
+        params = tuple(sys.intern(param.strip()) for param in params.group(1).split(",") if param.strip()) if params else ()
+        return cls(sys.intern(event), group, handler, params, labelled.get("example"), labelled.get("explanation"))
+
+    def as_dict(self, detailed=False):
+        record = {"event": self.event, "handler": self.handler, "params": list(self.params)}
+        if self.group is not None:
+            record["format"] = self.group
+        if detailed:
+            if self.example is not None:
+                record["example"] = self.example
+            if self.explanation is not None:
+                record["explanation"] = self.explanation
+        return record
+
+
+def _event_key(event):
+    return _NOT_KEY_CHAR.sub("", event.lower())
+
+
+class EventIndex:
+    """Event records of every knowledge entry, by key and normalized event name."""
+
+    def __init__(self, table):
+        self.events = {}
+        for key, entry in table.items():
+            events = entry.get("events")
+            if isinstance(events, list):
+                texts = [(None, text) for text in events]
+            elif isinstance(events, dict):
+                texts = [(group, text) for group, group_texts in events.items() for text in group_texts]
+            else:
+                continue
+            by_event = {}
+            for group, text in texts:
+                record = EventRecord.parse(text, group) if isinstance(text, str) else None
+                if record:
+                    by_event.setdefault(_event_key(record.event), []).append(record)
+            self.events[key] = by_event
+
+    def find(self, key, event=None):
+        """All records of `key`, or those of one event ("Click", "click" and "on-click" all match)."""
+        by_event = self.events.get(key, {})
+        if event is None:
+            return [record for records in by_event.values() for record in records]
+        name = _event_key(event)
+        if name not in by_event and name.startswith("on"):
+            name = name[2:]
+        return by_event.get(name, [])
+
+
+class KnowledgeSnapshot:
+    """One consistent version of the knowledge tables and everything derived from them.
+
+    Every knowledge file is read and verified when the snapshot is created; tables, fragments,
+    resolvers and indexes are built from those files on first use. A request takes the current
+    snapshot once and uses it throughout, so a reload in the middle never mixes two versions.
+    """
+
+    def __init__(self):
+        # Canonical instances of every loaded value, so equal strings, lists and dicts in both
+        # platforms' tables are stored once.
+        self.intern_pool = {}
+        self._layers = load_layers(self.intern_pool)
+        self._tables = {}
+        self._fragments = {}
+        self._projections = {}
+        self._resolvers = {}
+        self._indexes = {}
+        self._events = {}
+        self._lock = threading.RLock()
+
+    def _derived(self, cache, platform, build):
+        value = cache.get(platform)
+        if value is None:
+            with self._lock:
+                value = cache.get(platform)
+                if value is None:
+                    value = cache[platform] = build(platform)
+        return value
+
+    def _load_table(self, platform):
+        return intern_value(resolve_layers(self._layers[BASE_LAYER], self._layers[platform]), self.intern_pool)
+
+    def table(self, platform):
+        """The knowledge table of `platform`, resolved from the files read with the snapshot."""
+        if platform not in PLATFORMS:
+            raise UnknownPlatformError(platform)
+        return self._derived(self._tables, platform, self._load_table)
+
+    def fragments(self, platform):
+        """Precompiled JSON members of `platform`."""
+        return self._derived(self._fragments, platform, lambda p: compile_knowledge(self.table(p)))
+
+    def projections(self, platform):
+        """Per-section and per-member fragments of `platform`."""
+        return self._derived(self._projections, platform, lambda p: compile_projections(self.table(p)))
+
+    def resolver(self, platform):
+        """Key resolver of `platform`."""
+        return self._derived(self._resolvers, platform, lambda p: KeyResolver(self.table(p)))
+
+    def index(self, platform):
+        """Search index of `platform`."""
+        return self._derived(self._indexes, platform, lambda p: KnowledgeIndex(self.table(p)))
+
+    def events(self, platform):
+        """Parsed event records of `platform`."""
+        return self._derived(self._events, platform, lambda p: EventIndex(self.table(p)))
+
+    def resolve_keys(self, platform, names):
+        """Split requested names into (knowledge keys, {name: key} for renamed names, unresolved names)."""
+        resolver = self.resolver(platform)
+        keys = []
+        resolved = {}
+        unresolved = []
+        for name in dict.fromkeys(names):
+            key = resolver.resolve(name)
+            if key is None:
+                unresolved.append(name)
+                continue
+            if key != name:
+                resolved[name] = key
+            keys.append(key)
+        return keys, resolved, unresolved
+
+    def select_fragments(self, platform, keys, sections=None, members=None):
+        """(key, `"key":{...}` member) pairs for knowledge `keys`, whole or projected, and the requested
+        sections / members none of them has (see project_fragments); repeated keys are sent once."""
+        if sections is None and members is None:
+            fragments = self.fragments(platform)
+            return [(key, fragments[key]) for key in dict.fromkeys(keys)], {}
+        return project_fragments(self.projections(platform), keys, sections, members)
+
+    def lookup_parts(self, platform, names, sections=None, members=None, known_hashes=None):
+        """Resolve `names` and select their fragments, leaving out those the client holds (`known_hashes`).
+
+        Returns (fragment pairs, resolved names, unresolved names, unchanged keys, unmatched sections / members).
+        """
+        keys, resolved, unresolved = self.resolve_keys(platform, names)
+        fragments, unmatched = self.select_fragments(platform, keys, sections, members)
+        fragments, unchanged = split_unchanged(fragments, known_hashes)
+        return fragments, resolved, unresolved, unchanged, unmatched
+
+
+def current():
+    """The snapshot to serve a request from, created (and its files read) on first use."""
+    global _snapshot
+    snapshot = _snapshot
+    if snapshot is None:
+        with _swap_lock:
+            if _snapshot is None:
+                _snapshot = KnowledgeSnapshot()
+            snapshot = _snapshot
+    return snapshot
+
+
+def reload():
+    """Read the knowledge files again and swap the result in as the current snapshot.
+
+    Tables, fragments and resolvers of every platform are built before the swap, so requests
+    keep being served from the old snapshot until the new one is complete. If a file fails its
+    manifest check the error is raised and the current snapshot stays in place.
+    """
+    global _snapshot
+    snapshot = KnowledgeSnapshot()
+    for platform in PLATFORMS:
+        snapshot.fragments(platform)
+        snapshot.resolver(platform)
+    with _swap_lock:
+        _snapshot = snapshot
+    return snapshot
+
+
+def get_table(platform):
+    """The current knowledge table of `platform`."""
+    return current().table(platform)
+
+
+def get_index(platform):
+    return current().index(platform)
+
+
+def describe_events(platform, widget, event=None):
+    """Event signatures of `widget` as a JSON object, or the full record (with example) of one `event`.
+
+    Returns {"widget": key, "events": [...]}, with "resolved" / "unresolved" as in lookup.
+    """
+    snapshot = current()
+    keys, resolved, unresolved = snapshot.resolve_keys(platform, [widget])
+    result = {"widget": keys[0] if keys else None, "events": []}
+    if keys:
+        records = snapshot.events(platform).find(keys[0], event)
+        result["events"] = [record.as_dict(detailed=event is not None) for record in records]
+    if resolved:
+        result["resolved"] = resolved
+    if unresolved:
+        result["unresolved"] = unresolved
+    return json.dumps(result, separators=(",", ":"), ensure_ascii=False)
+
+
+def lookup_parts(platform, names, sections=None, members=None, known_hashes=None):
+    return current().lookup_parts(platform, names, sections, members, known_hashes)
+
+
+def lookup_members(platform, keys, sections=None, members=None, known_hashes=None):
+    """The members of `lookup` as JSON member strings, for embedding in a larger object."""
+    return format_lookup(*lookup_parts(platform, keys, sections, members, known_hashes))
+
+
+def lookup(platform, keys, sections=None, members=None, known_hashes=None):
+    """Knowledge for `keys`, optionally projected to some sections / members.
+
+    Returns a JSON object whose "knowledge" member is keyed by knowledge key and "hashes" holds
+    the content hash of each returned entry. Keys whose hash matches `known_hashes` (key ->
+    hash, as previously returned) are listed in "unchanged" instead of being sent again.
+    "resolved" maps requested names to the key they were matched to and "unresolved" lists
+    names with no match; "unmatched" lists the requested "sections" and "members" none of the
+    keys has. "unchanged", "resolved", "unresolved" and "unmatched" are present only when non-empty.
+    """
+    return "{" + ",".join(lookup_members(platform, keys, sections, members, known_hashes)) + "}"
+
+
+def rehash():
+    """Rewrite manifest.json after the knowledge files were edited."""
+    manifest = {
+        name: {
+            "file": f"{name}.json",
+            "sha256": hashlib.sha256((KNOWLEDGE_DIR / f"{name}.json").read_bytes()).hexdigest()
+        }
+        for name in (BASE_LAYER, *PLATFORMS)
+    }
+    (KNOWLEDGE_DIR / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    return manifest
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["rehash"]:
+        print(json.dumps(rehash(), indent=2))
+    else:
+        print("usage: python knowledge_store.py rehash")
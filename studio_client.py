@@ -0,0 +1,439 @@
+import asyncio
+import contextvars
+import hashlib
+import os
+import random
+import re
+import time
+import weakref
+from collections import deque
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+import httpx
+
+from cache import TTLCache
+
+# Pool and timeout settings for Studio calls, overridable from the environment.
+MAX_CONNECTIONS_PER_ORIGIN = int(os.environ.get("STUDIO_MAX_CONNECTIONS", "20"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get("STUDIO_MAX_KEEPALIVE_CONNECTIONS", "10"))
+KEEPALIVE_EXPIRY = float(os.environ.get("STUDIO_KEEPALIVE_EXPIRY", "60"))
+CONNECT_TIMEOUT = float(os.environ.get("STUDIO_CONNECT_TIMEOUT", "5"))
+READ_TIMEOUT = float(os.environ.get("STUDIO_READ_TIMEOUT", "30"))
+
+# Studio endpoints fall into a few classes that fail independently (page markup can be slow
+# while service definitions are fine). Each class has its own read timeout and circuit breaker.
+ENDPOINT_CLASSES = (
+    ("pages", re.compile(r"/pages/[^/]+/")),
+    ("services", re.compile(r"/servicedefs/|/services/[^/]+/types$")),
+    ("variables", re.compile(r"/variables$")),
+)
+DEFAULT_ENDPOINT_CLASS = "project"
+ENDPOINT_READ_TIMEOUTS = {
+    name: float(os.environ.get(f"STUDIO_READ_TIMEOUT_{name.upper()}", READ_TIMEOUT))
+    for name in (*(name for name, _ in ENDPOINT_CLASSES), DEFAULT_ENDPOINT_CLASS)
+}
+# A breaker opens after BREAKER_FAILURES consecutive calls end, retries included, in a timeout,
+# connection error or 5xx response, then rejects calls for BREAKER_RESET seconds before letting
+# one probe through.
+BREAKER_FAILURES = int(os.environ.get("STUDIO_BREAKER_FAILURES", "5"))
+BREAKER_RESET = float(os.environ.get("STUDIO_BREAKER_RESET", "30"))
+
+# Slow responses are hedged: once a GET has taken longer than the HEDGE_PERCENTILE latency of
+# its endpoint class (after HEDGE_MIN_SAMPLES calls), a second identical GET is sent and the
+# first response wins. Timeouts, connection errors and 502/503/504 are retried up to
+# MAX_ATTEMPTS times with jittered exponential backoff. Hedges and retries both draw on a
+# budget shared by all fetches of one tool call (see start_retry_budget).
+HEDGE_PERCENTILE = float(os.environ.get("STUDIO_HEDGE_PERCENTILE", "0.95"))
+HEDGE_MIN_SAMPLES = int(os.environ.get("STUDIO_HEDGE_MIN_SAMPLES", "20"))
+HEDGE_MIN_DELAY = float(os.environ.get("STUDIO_HEDGE_MIN_DELAY", "0.05"))
+LATENCY_SAMPLES = 200
+MAX_ATTEMPTS = int(os.environ.get("STUDIO_MAX_ATTEMPTS", "3"))
+RETRY_BASE_DELAY = float(os.environ.get("STUDIO_RETRY_BASE_DELAY", "0.1"))
+RETRY_MAX_DELAY = float(os.environ.get("STUDIO_RETRY_MAX_DELAY", "2"))
+RETRIES_PER_REQUEST = int(os.environ.get("STUDIO_RETRIES_PER_REQUEST", "4"))
+RETRY_STATUSES = {502, 503, 504}
+
+# ETag / Last-Modified validators, the parsed body they belong to and the auth scopes that were
+# served that body, per URL.
+VALIDATOR_CACHE_SIZE = int(os.environ.get("STUDIO_VALIDATOR_CACHE_SIZE", "1024"))
+_validated = TTLCache(VALIDATOR_CACHE_SIZE)
+
+# Recent failures that are answered locally instead of asking Studio again: missing resources
+# (404 / 410) per URL, rejected credentials (401) per auth scope and forbidden resources (403)
+# per auth scope and URL. Server errors are never remembered.
+NOT_FOUND_TTL = float(os.environ.get("STUDIO_NOT_FOUND_TTL", "30"))
+AUTH_FAILURE_TTL = float(os.environ.get("STUDIO_AUTH_FAILURE_TTL", "10"))
+FAILURE_CACHE_SIZE = int(os.environ.get("STUDIO_FAILURE_CACHE_SIZE", "1024"))
+NOT_FOUND_STATUSES = {404, 410}
+_missing = TTLCache(FAILURE_CACHE_SIZE, NOT_FOUND_TTL)
+_auth_failures = TTLCache(FAILURE_CACHE_SIZE, AUTH_FAILURE_TTL)
+
+# One long-lived client per origin (and per event loop); connections are kept alive between calls.
+_clients = weakref.WeakKeyDictionary()
+
+_breakers = {}
+_latencies = {}
+# Primary requests that lost to their hedge, kept referenced until they finish and are timed.
+_timed = set()
+_retry_budget = contextvars.ContextVar("studio_retry_budget", default=None)
+
+# Fetches currently in progress, per event loop, keyed e.g. by (method, URL, auth scope).
+_in_flight = weakref.WeakKeyDictionary()
+AUTH_HEADERS = ("cookie", "authorization")
+
+
+def _no_cookie_jar():
+    # The client is shared by every user, so cookies set by Studio must never be stored
+    # and replayed on someone else's request. Auth is always sent explicitly per call.
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+
+
+def get_client(url):
+    """Return the pooled client for the origin of `url`, creating it on first use."""
+    origin = httpx.URL(url).copy_with(path="/", query=None, fragment=None)
+    loop_clients = _clients.setdefault(asyncio.get_running_loop(), {})
+    client = loop_clients.get(str(origin))
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS_PER_ORIGIN,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+            cookies=_no_cookie_jar(),
+            follow_redirects=True,
+        )
+        loop_clients[str(origin)] = client
+    return client
+
+
+async def get(url, headers=None, timeout=httpx.USE_CLIENT_DEFAULT):
+    return await get_client(url).get(url, headers=headers, timeout=timeout)
+
+
+def endpoint_class(url):
+    path = httpx.URL(url).path
+    for name, pattern in ENDPOINT_CLASSES:
+        if pattern.search(path):
+            return name
+    return DEFAULT_ENDPOINT_CLASS
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of a request while the breaker of its endpoint class is open."""
+
+
+# Permit returned by CircuitBreaker.allow to the one call let through while half-open.
+PROBE = "probe"
+
+
+class CircuitBreaker:
+    """Closed, open or half-open state of one endpoint class.
+
+    Closed lets every call through and counts consecutive failures; at `failures` it opens and
+    rejects calls for `reset` seconds. After that a single probe is let through (half-open):
+    its success closes the breaker, its failure opens it again.
+    """
+
+    def __init__(self, name, failures=BREAKER_FAILURES, reset=BREAKER_RESET):
+        self.name = name
+        self.failures = failures
+        self.reset = reset
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.probing = False
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return "closed"
+        return "half-open" if self.probing else "open"
+
+    def allow(self):
+        """False if the call must not go through, PROBE if it is the half-open probe, else True."""
+        if self.opened_at is None:
+            return True
+        if self.probing or time.monotonic() - self.opened_at < self.reset:
+            return False
+        self.probing = True
+        return PROBE
+
+    def release(self, permit):
+        """Give back a permit whose call ended without an outcome, e.g. because it was cancelled."""
+        if permit is PROBE:
+            self.probing = False
+
+    def record_success(self):
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.probing = False
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        if self.probing or self.consecutive_failures >= self.failures:
+            self.opened_at = time.monotonic()
+        self.probing = False
+
+
+def get_breaker(name):
+    breaker = _breakers.get(name)
+    if breaker is None:
+        breaker = _breakers[name] = CircuitBreaker(name)
+    return breaker
+
+
+def breaker_states():
+    return {name: breaker.state for name, breaker in _breakers.items()}
+
+
+class LatencyTracker:
+    """Recent response times of one endpoint class."""
+
+    def __init__(self, size=LATENCY_SAMPLES):
+        self.samples = deque(maxlen=size)
+
+    def record(self, seconds):
+        self.samples.append(seconds)
+
+    def percentile(self, fraction):
+        """The `fraction` latency percentile, or None until HEDGE_MIN_SAMPLES were recorded."""
+        if len(self.samples) < HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class RetryBudget:
+    __slots__ = ("remaining",)
+
+    def __init__(self, remaining):
+        self.remaining = remaining
+
+    def take(self):
+        if self.remaining <= 0:
+            return False
+        self.remaining -= 1
+        return True
+
+
+def start_retry_budget(retries=RETRIES_PER_REQUEST):
+    """Share `retries` hedges and retries between all Studio fetches made from now on in this
+    task and the tasks it starts. Without a budget only MAX_ATTEMPTS limits each call."""
+    _retry_budget.set(RetryBudget(retries))
+
+
+def _take_retry():
+    budget = _retry_budget.get()
+    return budget is None or budget.take()
+
+
+async def _first_response(tasks):
+    """Result of the first of `tasks` to succeed, or the last error if all of them fail."""
+    pending = set(tasks)
+    while True:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        succeeded = [task for task in done if task.exception() is None]
+        if succeeded:
+            return succeeded[0].result()
+        if not pending:
+            return done.pop().result()
+
+
+async def hedged_get(url, headers, endpoint, timeout=httpx.USE_CLIENT_DEFAULT):
+    """GET `url`, sending a backup request if it is slower than usual for its endpoint class."""
+    tracker = _latencies.get(endpoint)
+    if tracker is None:
+        tracker = _latencies[endpoint] = LatencyTracker()
+    delay = tracker.percentile(HEDGE_PERCENTILE)
+    started = time.monotonic()
+    primary = asyncio.ensure_future(get(url, headers=headers, timeout=timeout))
+
+    def record_primary(task):
+        # Only the primary request is timed. Timing whichever response came first would make the
+        # endpoint look faster with every hedge and lower the delay before the next one.
+        _timed.discard(task)
+        if not task.cancelled() and task.exception() is None:
+            tracker.record(time.monotonic() - started)
+
+    primary.add_done_callback(record_primary)
+    tasks = [primary]
+    hedge_won = False
+    try:
+        if delay is not None:
+            done, _ = await asyncio.wait(tasks, timeout=max(delay, HEDGE_MIN_DELAY))
+            if not done and _take_retry():
+                tasks.append(asyncio.ensure_future(get(url, headers=headers, timeout=timeout)))
+        response = await _first_response(tasks)
+        hedge_won = not primary.done()
+    finally:
+        for task in tasks:
+            if task is primary and hedge_won:
+                # Left to finish (within its timeout) only so that its latency is recorded.
+                _timed.add(primary)
+            else:
+                task.cancel()
+    return response
+
+
+async def _backoff(attempt, breaker):
+    """Wait before another attempt if one is allowed and return the breaker's permit for it;
+    False if the call should give up."""
+    permit = attempt < MAX_ATTEMPTS and breaker.allow()
+    if permit and not _take_retry():
+        breaker.release(permit)
+        return False
+    if permit:
+        try:
+            await asyncio.sleep(random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))))
+        except BaseException:
+            # The caller never sees this permit, so give it back here.
+            breaker.release(permit)
+            raise
+    return permit
+
+
+def auth_scope(headers):
+    """Hash of the credentials carried by `headers`; requests with equal scopes see the same data."""
+    credentials = "\n".join(
+        f"{name.lower()}:{value}" for name, value in sorted((headers or {}).items()) if name.lower() in AUTH_HEADERS
+    )
+    return hashlib.blake2b(credentials.encode(), digest_size=16).hexdigest()
+
+
+class RecentFailureError(Exception):
+    """Raised instead of a request whose resource or credentials failed with `status_code` moments ago."""
+
+    def __init__(self, url, status_code):
+        super().__init__(f"{url} recently failed with status {status_code}")
+        self.url = url
+        self.status_code = status_code
+
+
+def is_missing(error):
+    """Whether `error`, raised by get_json, means the resource does not exist rather than that fetching it failed."""
+    if isinstance(error, RecentFailureError):
+        return error.status_code in NOT_FOUND_STATUSES
+    return isinstance(error, httpx.HTTPStatusError) and error.response.status_code in NOT_FOUND_STATUSES
+
+
+def forget_failure(url):
+    """Stop answering `url` from the missing-resource cache, e.g. after it was created."""
+    _missing.pop(url)
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task):
+        self.task = task
+        self.waiters = 0
+
+
+async def coalesce(key, fetch):
+    """Await `fetch()`, sharing one run of it between overlapping calls with the same `key`.
+
+    Every caller gets the same result (or error). The shared run is cancelled only when every
+    caller waiting on it has been cancelled.
+    """
+    flights = _in_flight.setdefault(asyncio.get_running_loop(), {})
+    flight = flights.get(key)
+    if flight is None:
+        flight = flights[key] = _Flight(asyncio.ensure_future(fetch()))
+        flight.task.add_done_callback(lambda _: flights.pop(key) if flights.get(key) is flight else None)
+    flight.waiters += 1
+    try:
+        return await asyncio.shield(flight.task)
+    finally:
+        flight.waiters -= 1
+        if not flight.waiters and not flight.task.done():
+            # Callers arriving while the cancelled run winds down start a fresh one.
+            if flights.get(key) is flight:
+                del flights[key]
+            flight.task.cancel()
+
+
+async def get_json(url, headers=None):
+    """GET `url` and return its parsed JSON body, sharing the fetch with identical concurrent calls.
+
+    Calls for the same URL and auth scope that overlap wait on one upstream request and get the
+    same parsed body (or error).
+    """
+    scope = auth_scope(headers)
+    return await coalesce(("GET", url, scope), lambda: _get_json(url, headers, scope))
+
+
+async def _get_json(url, headers, scope):
+    """GET `url` and return its parsed JSON body, revalidating bodies fetched before.
+
+    The ETag / Last-Modified of each response is remembered per URL and sent back as
+    If-None-Match / If-Modified-Since, so an unchanged resource costs a 304 and reuses the
+    previously parsed body. Bodies are shared between callers and must be treated as read-only.
+    A URL or auth scope that recently failed raises RecentFailureError without a request, and
+    while the endpoint class's breaker is open the call fails fast with CircuitOpenError or,
+    if this auth scope was served the URL before, returns that stale body.
+    """
+    status_code = _auth_failures.get(scope) or _auth_failures.get((scope, url)) or _missing.get(url)
+    if status_code:
+        raise RecentFailureError(url, status_code)
+    cached = _validated.get(url)
+    breaker = get_breaker(endpoint_class(url))
+    permit = breaker.allow()
+    if not permit:
+        # While Studio is failing, answer from the last body this auth scope was served, if any.
+        if cached is not None and scope in cached[3]:
+            return cached[2]
+        raise CircuitOpenError(f"{breaker.name} requests to Studio are failing; retry in a few seconds")
+    request_headers = dict(headers or {})
+    if cached is not None:
+        etag, last_modified = cached[:2]
+        if etag:
+            request_headers["If-None-Match"] = etag
+        if last_modified:
+            request_headers["If-Modified-Since"] = last_modified
+    timeout = httpx.Timeout(ENDPOINT_READ_TIMEOUTS[breaker.name], connect=CONNECT_TIMEOUT)
+    attempt = 1
+    try:
+        while True:
+            try:
+                response = await hedged_get(url, request_headers, breaker.name, timeout)
+            except httpx.TransportError:
+                # Only the outcome of the last attempt counts toward the breaker, so the retries of
+                # one slow call cannot open it for the whole endpoint class.
+                permit = await _backoff(attempt, breaker)
+                if not permit:
+                    breaker.record_failure()
+                    raise
+            else:
+                if response.status_code < 500:
+                    breaker.record_success()
+                    break
+                permit = response.status_code in RETRY_STATUSES and await _backoff(attempt, breaker)
+                if not permit:
+                    breaker.record_failure()
+                    break
+            attempt += 1
+    except BaseException:
+        # A cancelled (or otherwise aborted) probe says nothing about Studio; let the next call
+        # probe. Aborting any other call leaves the breaker as it is.
+        breaker.release(permit)
+        raise
+    if response.status_code == 304 and cached is not None:
+        cached[3].add(scope)
+        return cached[2]
+    if response.status_code in NOT_FOUND_STATUSES:
+        _missing.set(url, response.status_code)
+        _validated.pop(url)
+    elif response.status_code == 401:
+        _auth_failures.set(scope, response.status_code)
+    elif response.status_code == 403:
+        _auth_failures.set((scope, url), response.status_code)
+    response.raise_for_status()
+    body = response.json()
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        _validated.set(url, (etag, last_modified, body, {scope}))
+    else:
+        _validated.pop(url)
+    return body
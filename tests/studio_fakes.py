@@ -0,0 +1,32 @@
+"""Fake Studio pages and a fake studio_client.get shared by the tests."""
+import asyncio
+import json
+import random
+from urllib.parse import quote_plus
+
+import httpx
+
+
+def encode(text):
+    return quote_plus(text)
+
+
+def studio_markup(root):
+    # Studio wraps every page in a document; the page type is read from the tag after <body>.
+    return encode(f"<html><head></head><body>{root}</body></html>")
+
+
+def studio_page(encoded_markup):
+    return {"markup": encoded_markup, "variables": encode(json.dumps({}))}
+
+
+def fake_get(resources):
+    async def get(url, headers=None, timeout=None):
+        # Finish requests in a random order so the calls interleave at every await.
+        await asyncio.sleep(random.uniform(0, 0.003))
+        request = httpx.Request("GET", url, headers=headers)
+        body = resources.get(httpx.URL(url).path)
+        if body is None:
+            return httpx.Response(404, request=request)
+        return httpx.Response(200, json=body, request=request)
+    return get
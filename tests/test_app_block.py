@@ -0,0 +1,114 @@
+import asyncio
+import hashlib
+import json
+
+import httpx
+
+import context_extractor
+import studio_client
+from studio_fakes import studio_markup, studio_page
+
+PROJECT_ID = "AppBlockProject"
+PROJECT_PATH = f"/studio/services/projects/{PROJECT_ID}"
+COMMON_PATH = f"{PROJECT_PATH}/pages/Common/page.min.json"
+VARIABLES_PATH = f"{PROJECT_PATH}/variables"
+
+
+def common_page(widget):
+    return studio_page(studio_markup(f'<wm-page name="common"><wm-dialog name="{widget}"></wm-dialog></wm-page>'))
+
+
+def revalidating_get(resources, statuses, validators=True):
+    """Fake studio_client.get that sends ETags (unless `validators` is false) and answers 304 to a
+    matching If-None-Match."""
+    async def get(url, headers=None, timeout=None):
+        request = httpx.Request("GET", url, headers=headers)
+        path = httpx.URL(url).path
+        if path in resources and resources[path] is None:
+            statuses.append((path, 503))
+            return httpx.Response(503, request=request)
+        body = resources.get(path)
+        if body is None:
+            return httpx.Response(404, request=request)
+        etag = '"' + hashlib.sha256(json.dumps(body, sort_keys=True).encode()).hexdigest() + '"'
+        status = 304 if (headers or {}).get("If-None-Match") == etag else 200
+        statuses.append((path, status))
+        if status == 304:
+            return httpx.Response(304, headers={"ETag": etag}, request=request)
+        return httpx.Response(200, json=body, headers={"ETag": etag} if validators else {}, request=request)
+    return get
+
+
+def test_app_block_is_revalidated_once_stale(monkeypatch):
+    resources = {
+        COMMON_PATH: common_page("firstDialog"),
+        VARIABLES_PATH: {"model": {"category": "wm.Variable", "type": "string"}},
+    }
+    statuses = []
+    monkeypatch.setattr(studio_client, "get", revalidating_get(resources, statuses))
+    monkeypatch.setattr(studio_client, "_breakers", {})
+    monkeypatch.setattr(context_extractor, "APP_CONTEXT_FRESH", 0)
+
+    def app_block():
+        return asyncio.run(context_extractor.get_app_block(PROJECT_ID, "cookie"))
+
+    first = app_block()
+    assert list(first["Widgets"]) == ["firstDialog"]
+
+    # Unchanged: both resources answer 304 and the cached block is reused as it is.
+    statuses.clear()
+    assert app_block() is first
+    assert sorted(statuses) == [(COMMON_PATH, 304), (VARIABLES_PATH, 304)]
+
+    # An edit to the Common page shows up on the next call, without a refresh.
+    resources[COMMON_PATH] = common_page("editedDialog")
+    edited = app_block()
+    assert list(edited["Widgets"]) == ["editedDialog"]
+    assert edited["Variables"] == first["Variables"]
+
+    # While Studio fails, the last block is served.
+    resources[COMMON_PATH] = None
+    assert app_block() is edited
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+def test_app_block_without_validators_is_reused_while_unchanged(monkeypatch):
+    project_id = "AppBlockNoValidatorsProject"
+    project_path = f"/studio/services/projects/{project_id}"
+    common_path = f"{project_path}/pages/Common/page.min.json"
+    resources = {
+        common_path: common_page("dialog"),
+        f"{project_path}/variables": {"model": {"category": "wm.Variable", "type": "string"}},
+    }
+    statuses = []
+    clock = Clock()
+    monkeypatch.setattr(studio_client, "get", revalidating_get(resources, statuses, validators=False))
+    monkeypatch.setattr(context_extractor, "time", clock)
+    monkeypatch.setattr(context_extractor, "APP_CONTEXT_FRESH", 5)
+
+    def app_block():
+        return asyncio.run(context_extractor.get_app_block(project_id, "cookie"))
+
+    first = app_block()
+    assert len(statuses) == 2
+
+    # Within the freshness window nothing is fetched.
+    clock.now += 4
+    assert app_block() is first
+    assert len(statuses) == 2
+
+    # Once stale, both are fetched in full, but equal content keeps the built block.
+    clock.now += 2
+    assert app_block() is first
+    assert len(statuses) == 4
+
+    resources[common_path] = common_page("editedDialog")
+    clock.now += 6
+    assert list(app_block()["Widgets"]) == ["editedDialog"]
@@ -0,0 +1,53 @@
+import asyncio
+import json
+
+import budget
+import context_extractor
+import knowledge_store
+import studio_client
+from studio_fakes import encode, fake_get, studio_markup, studio_page
+
+PROJECT_ID = "BudgetProject"
+PROJECT_PATH = f"/studio/services/projects/{PROJECT_ID}"
+
+
+def test_lookup_fits_the_whole_response_in_the_budget():
+    keys = list(knowledge_store.current().table("web"))[:8]
+    full = budget.estimate_tokens(budget.lookup("web", keys + ["tble", "nosuch"], max_tokens=10 ** 6))
+
+    for max_tokens in (300, 1000, 2000, full - 50):
+        response = budget.lookup("web", keys + ["tble", "nosuch"], max_tokens=max_tokens)
+        report = json.loads(response)["budget"]
+        assert report["elided"]
+        assert budget.estimate_tokens(response) == report["estimatedTokens"] <= max_tokens
+
+    report = json.loads(budget.lookup("web", keys, max_tokens=full))["budget"]
+    assert report["elided"] == []
+
+
+def test_context_with_knowledge_fits_the_budget(monkeypatch):
+    common_widgets = "".join(f'<wm-button name="commonButton{index}" caption="Common {index}"></wm-button>' for index in range(40))
+    resources = {
+        "/details": {"displayName": "Budget", "platformType": "WEB"},
+        "/variables": {"model": {"category": "wm.Variable", "type": "string"}},
+        "/pages/Common/page.min.json": studio_page(studio_markup(f'<wm-page name="common">{common_widgets}</wm-page>')),
+        "/pages/Main/page.min.json": {
+            "markup": studio_markup('<wm-page name="main"><wm-label name="title"></wm-label><wm-form name="orderForm">'
+                                    '<wm-form-field name="qty" widget="number"></wm-form-field></wm-form></wm-page>'),
+            "variables": encode(json.dumps({})),
+        },
+    }
+    monkeypatch.setattr(studio_client, "get", fake_get({PROJECT_PATH + path: body for path, body in resources.items()}))
+
+    def build(max_tokens):
+        return asyncio.run(context_extractor.build_llm_context_with_knowledge(PROJECT_ID, "Main", "cookie", max_tokens))
+
+    full = budget.estimate_tokens(build(10 ** 6))
+    page_only = budget.estimate_tokens(json.dumps(json.loads(build(None))["appContext"]["Page"]))
+
+    for max_tokens in (page_only + 200, full // 2, full - 20):
+        response = build(max_tokens)
+        result = json.loads(response)
+        assert budget.estimate_tokens(response) == result["budget"]["estimatedTokens"] <= max_tokens
+        assert "title" in result["appContext"]["Page"]["Widgets"]
+    assert "appContext.App" in json.loads(build(page_only + 200))["budget"]["elided"]
@@ -0,0 +1,34 @@
+import context_extractor
+
+
+def test_collects_widget_variable_and_action_categories_only():
+    app_context = {
+        "Page": {
+            "Widgets": {
+                "orderForm": {"category": "form", "formWidgets": {"qty": {"category": "form-field"}}},
+                "orders": {"category": "table", "table-columns": {"id": {"category": "table-column"}}},
+                "items": {"category": "list", "list-item-widgets": {"itemLabel": {"category": "label"}}},
+                "header": {
+                    "category": "container", "type": "partial", "content": "Header",
+                    "Widgets": {"logo": {"category": "picture"}, "loop": {"category": "container", "cyclic": True, "Widgets": None}},
+                    "Variables": {"headerData": {"category": "wm.LiveVariable", "dataSet": ["id"]}},
+                    "Actions": None,
+                },
+            },
+            "Variables": {
+                "staticData": {
+                    "category": "wm.Variable", "type": "object",
+                    "dataSet": [{"name": "a", "category": "shoes"}, {"nested": {"category": "hats"}}],
+                },
+            },
+            "Actions": {"goHome": {"category": "wm.NavigationVariable", "target_location": "gotoPage Main"}},
+        },
+        "App": {"Widgets": {"dlg": {"category": "dialog"}}, "Variables": {}, "Actions": {}},
+        "metaData": {"category": "ignored"},
+        "prefabs": [{"name": "p", "category": "ignored"}],
+    }
+
+    assert context_extractor.collect_categories(app_context) == [
+        "form", "form-field", "table", "table-column", "list", "label", "wm.Variable", "wm.NavigationVariable",
+        "dialog", "picture", "wm.LiveVariable",
+    ]
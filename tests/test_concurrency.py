@@ -0,0 +1,96 @@
+import asyncio
+import json
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import context_extractor
+import studio_client
+from studio_fakes import fake_get, studio_markup, studio_page
+
+PROJECT_ID = "ConcurrencyProject"
+PROJECT_PATH = f"/studio/services/projects/{PROJECT_ID}"
+ROOT_TAGS = {"Page": "wm-page", "Prefab": "wm-prefab-container", "Partial": "wm-partial"}
+CALLS = 210
+
+
+def markup(page_type, index):
+    """Markup of a page of `page_type` whose only widget is named after `index`, so every page
+    parses differently and no call can be answered from another call's memoized parse."""
+    tag = ROOT_TAGS[page_type]
+    content = f'<wm-label name="label{index}" caption="{page_type} {index}"></wm-label>'
+    if page_type == "Page":
+        content += '<wm-container name="shared" content="Shared"></wm-container>'
+    return studio_markup(f'<{tag} name="root{index}">{content}</{tag}>')
+
+
+def build_resources(pages):
+    resources = {
+        "/details": {"displayName": "Concurrency", "platformType": "WEB"},
+        "/variables": {"model": {"category": "wm.Variable", "type": "string"}},
+        "/pages/Common/page.min.json": studio_page(studio_markup('<wm-page name="common"><wm-dialog name="dlg"></wm-dialog></wm-page>')),
+        "/pages/Shared/page.min.json": studio_page(studio_markup('<wm-partial name="shared"><wm-text name="sharedText"></wm-text></wm-partial>')),
+        "/resources/content/web/config.json": {"properties": {}, "methods": {}, "events": {}},
+    }
+    for page_name, (page_type, index) in pages.items():
+        resources[f"/pages/{page_name}/page.min.json"] = studio_page(markup(page_type, index))
+    return {PROJECT_PATH + path: body for path, body in resources.items()}
+
+
+def mixed_pages(count, first=0):
+    page_types = list(ROOT_TAGS) * (count // len(ROOT_TAGS))
+    random.shuffle(page_types)
+    return {f"{page_type}{index}": (page_type, index) for index, page_type in enumerate(page_types, first)}
+
+
+def test_concurrent_contexts_keep_their_page_type(monkeypatch):
+    pages = mixed_pages(CALLS)
+    monkeypatch.setattr(studio_client, "get", fake_get(build_resources(pages)))
+
+    async def build_all():
+        return await asyncio.gather(
+            *(context_extractor.build_llm_context(PROJECT_ID, page_name, "cookie") for page_name in pages)
+        )
+
+    results = [json.loads(result) for result in asyncio.run(build_all())]
+
+    assert len(results) == CALLS
+    for (page_name, (page_type, index)), result in zip(pages.items(), results):
+        assert result["projectDetails"]["pageType"] == page_type, page_name
+        assert result["projectDetails"]["pageName"] == page_name
+        sections = result["appContext"].keys() & ROOT_TAGS.keys()
+        assert sections == {page_type}, page_name
+        assert list(result["appContext"][page_type]["Widgets"])[0] == f"label{index}"
+        if page_type == "Page":
+            shared = result["appContext"]["Page"]["Widgets"]["shared"]
+            assert list(shared["Widgets"]) == ["sharedText"]
+
+
+def test_parse_widgets_on_threads_keeps_page_type():
+    # Numbered after the pages of the other test so that none of them is parsed already.
+    pages = mixed_pages(CALLS, first=CALLS)
+
+    def parse(page):
+        page_type, index = page
+        return context_extractor.parse_widgets(markup(page_type, index))
+
+    with ThreadPoolExecutor(16) as pool:
+        extractions = list(pool.map(parse, pages.values()))
+
+    for (page_type, index), extraction in zip(pages.values(), extractions):
+        assert extraction.page_type == page_type
+        assert f"label{index}" in extraction.widgets
+
+
+def test_contexts_build_in_successive_event_loops(monkeypatch):
+    # Nothing module-level may stay bound to the event loop of an earlier asyncio.run.
+    pages = mixed_pages(30, first=2 * CALLS)
+    monkeypatch.setattr(studio_client, "get", fake_get(build_resources(pages)))
+
+    async def build_all():
+        return await asyncio.gather(
+            *(context_extractor.build_llm_context(PROJECT_ID, page_name, "cookie") for page_name in pages)
+        )
+
+    for _ in range(2):
+        results = [json.loads(result) for result in asyncio.run(build_all())]
+        assert [result["projectDetails"]["pageName"] for result in results] == list(pages)
@@ -0,0 +1,66 @@
+import json
+import shutil
+
+import pytest
+
+import knowledge_store
+
+
+@pytest.fixture
+def knowledge_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "knowledge"
+    shutil.copytree(knowledge_store.KNOWLEDGE_DIR, directory)
+    monkeypatch.setattr(knowledge_store, "KNOWLEDGE_DIR", directory)
+    return directory
+
+
+def edit(path, change):
+    data = json.loads(path.read_text(encoding="utf-8"))
+    change(data)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_snapshot_is_one_version_of_the_files(knowledge_dir):
+    snapshot = knowledge_store.KnowledgeSnapshot()
+    web = snapshot.table("web")
+    # Edited after the snapshot was taken but before the platform is first used, and not rehashed.
+    edit(knowledge_dir / "base.json", lambda data: data.clear())
+    edit(knowledge_dir / "mobile.json", lambda data: data.clear())
+
+    mobile = snapshot.table("mobile")
+
+    assert mobile
+    assert snapshot.table("web") is web
+    with pytest.raises(knowledge_store.KnowledgeIntegrityError):
+        knowledge_store.KnowledgeSnapshot()
+
+
+def test_reload_keeps_serving_the_old_snapshot_until_the_files_verify(knowledge_dir, monkeypatch):
+    monkeypatch.setattr(knowledge_store, "_snapshot", None)
+    before = knowledge_store.current()
+    key = next(iter(before.table("web")))
+    edit(knowledge_dir / "web.json", lambda data: data[key].update(name="renamed"))
+
+    with pytest.raises(knowledge_store.KnowledgeIntegrityError):
+        knowledge_store.reload()
+    assert knowledge_store.current() is before
+
+    knowledge_store.rehash()
+    after = knowledge_store.reload()
+
+    assert knowledge_store.current() is after
+    assert after.table("web")[key]["name"] == "renamed"
+    assert before.table("web")[key].get("name") != "renamed"
+
+
+def test_projection_reports_unmatched_sections_and_members():
+    result = json.loads(knowledge_store.lookup("web", ["list"], sections=["nosuch", "methods"]))
+    assert list(result["knowledge"]["list"]) == ["methods"]
+    assert result["unmatched"] == {"sections": ["nosuch"]}
+
+    result = json.loads(knowledge_store.lookup("web", ["list", "form"], members=["DeselectItem", "nope"]))
+    assert [method["name"] for method in result["knowledge"]["list"]["methods"]] == ["deselectItem"]
+    assert result["unmatched"] == {"members": ["nope"]}
+
+    assert "unmatched" not in json.loads(knowledge_store.lookup("web", ["list"], sections=["methods"]))
+    assert "unmatched" not in json.loads(knowledge_store.lookup("web", ["list"]))
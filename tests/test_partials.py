@@ -0,0 +1,85 @@
+import asyncio
+
+import httpx
+
+import context_extractor
+import studio_client
+from studio_fakes import fake_get, studio_markup, studio_page
+
+PROJECT_ID = "PartialsProject"
+PROJECT_PATH = f"/studio/services/projects/{PROJECT_ID}"
+
+
+def container(name, partial):
+    return f'<wm-container name="{name}" content="{partial}"></wm-container>'
+
+
+def partial_markup(name, content):
+    return studio_markup(f'<wm-partial name="{name}">{content}</wm-partial>')
+
+
+def serve(monkeypatch, partials):
+    resources = {
+        f"{PROJECT_PATH}/pages/{name}/page.min.json": studio_page(partial_markup(name, content))
+        for name, content in partials.items()
+    }
+    requests = []
+    get = fake_get(resources)
+
+    async def counting_get(url, headers=None, timeout=None):
+        requests.append(httpx.URL(url).path)
+        return await get(url, headers=headers, timeout=timeout)
+
+    monkeypatch.setattr(studio_client, "get", counting_get)
+    return requests
+
+
+def expand(page_content):
+    encoded = studio_markup(f'<wm-page name="main">{page_content}</wm-page>')
+    extraction = asyncio.run(context_extractor.extract_widgets_preserving_children(encoded, PROJECT_ID, "cookie"))
+    return extraction.widgets
+
+
+def test_self_reference_is_flagged_cyclic(monkeypatch):
+    serve(monkeypatch, {"Loop": '<wm-text name="loopText"></wm-text>' + container("again", "Loop")})
+
+    widgets = expand(container("outer", "Loop"))
+
+    loop = widgets["outer"]["Widgets"]
+    assert list(loop) == ["loopText", "again"]
+    assert loop["again"]["cyclic"] is True
+    assert loop["again"]["Widgets"] is None
+
+
+def test_cycle_reached_from_two_containers(monkeypatch):
+    serve(monkeypatch, {
+        "A": '<wm-text name="aText"></wm-text>' + container("toB", "B"),
+        "B": '<wm-text name="bText"></wm-text>' + container("toA", "A"),
+    })
+
+    widgets = expand(container("first", "A") + container("second", "B"))
+
+    # Main -> A -> B -> A: only the reference closing the cycle is cut; B keeps its widgets.
+    a = widgets["first"]["Widgets"]
+    assert "cyclic" not in widgets["first"]
+    assert a["toB"]["Widgets"]["bText"] == {"category": "text"}
+    assert a["toB"]["Widgets"]["toA"]["cyclic"] is True
+    assert "cyclic" not in a["toB"]
+    b = widgets["second"]["Widgets"]
+    assert b["toA"]["Widgets"]["aText"] == {"category": "text"}
+    assert b["toA"]["Widgets"]["toB"]["cyclic"] is True
+    assert "cyclic" not in b["toA"]
+
+
+def test_shared_partial_is_fetched_once(monkeypatch):
+    requests = serve(monkeypatch, {
+        "Shared": '<wm-text name="sharedText"></wm-text>',
+        "Wrapper": container("wrapped", "Shared"),
+    })
+
+    widgets = expand(container("one", "Shared") + container("two", " Shared ") + container("three", "Wrapper"))
+
+    assert requests.count(f"{PROJECT_PATH}/pages/Shared/page.min.json") == 1
+    for name in ("one", "two"):
+        assert list(widgets[name]["Widgets"]) == ["sharedText"]
+    assert list(widgets["three"]["Widgets"]["wrapped"]["Widgets"]) == ["sharedText"]
@@ -0,0 +1,316 @@
+import asyncio
+import random
+
+import httpx
+import pytest
+
+import studio_client
+
+ORIGIN = "https://studio.test"
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    # Breakers and latency samples are per endpoint class and shared by the whole process.
+    monkeypatch.setattr(studio_client, "_breakers", {})
+    monkeypatch.setattr(studio_client, "_latencies", {})
+    monkeypatch.setattr(studio_client, "RETRY_BASE_DELAY", 0.001)
+
+
+def scripted_get(monkeypatch, outcomes):
+    """Fake studio_client.get answering each call with the next of `outcomes` (a status, exception
+    or (seconds, status) pair) and recording the URLs it was called with."""
+    outcomes = iter(outcomes)
+    calls = []
+
+    async def get(url, headers=None, timeout=None):
+        calls.append(url)
+        outcome = next(outcomes)
+        if isinstance(outcome, tuple):
+            seconds, outcome = outcome
+            await asyncio.sleep(seconds)
+        if isinstance(outcome, Exception):
+            raise outcome
+        request = httpx.Request("GET", url, headers=headers)
+        return httpx.Response(outcome, json={"status": outcome}, request=request)
+
+    monkeypatch.setattr(studio_client, "get", get)
+    return calls
+
+
+def test_retries_transient_failures_with_backoff(monkeypatch):
+    calls = scripted_get(monkeypatch, [502, 503, 200, 504, httpx.ConnectError("refused"), 200])
+    backoffs = []
+    uniform = random.uniform
+    monkeypatch.setattr(random, "uniform", lambda low, high: backoffs.append(high) or uniform(low, high))
+
+    async def fetch():
+        return [await studio_client.get_json(f"{ORIGIN}/retried/{index}") for index in range(2)]
+
+    assert asyncio.run(fetch()) == [{"status": 200}, {"status": 200}]
+    assert calls == [f"{ORIGIN}/retried/0"] * 3 + [f"{ORIGIN}/retried/1"] * 3
+    # Exponential backoff from RETRY_BASE_DELAY, restarting for each call.
+    assert backoffs == [0.001, 0.002, 0.001, 0.002]
+
+
+def test_gives_up_after_max_attempts(monkeypatch):
+    calls = scripted_get(monkeypatch, [503] * studio_client.MAX_ATTEMPTS)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        asyncio.run(studio_client.get_json(f"{ORIGIN}/exhausted"))
+    assert len(calls) == studio_client.MAX_ATTEMPTS
+
+
+def test_retry_budget_is_shared_by_one_tool_call(monkeypatch):
+    calls = scripted_get(monkeypatch, [503] * 10)
+
+    async def tool_call():
+        studio_client.start_retry_budget(2)
+        return await asyncio.gather(
+            *(studio_client.get_json(f"{ORIGIN}/budget/{index}") for index in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(tool_call())
+
+    assert all(isinstance(result, httpx.HTTPStatusError) for result in results)
+    # One request per fetch plus the two retries the budget allows, between all three fetches.
+    assert len(calls) == 3 + 2
+
+
+def test_one_breaker_failure_per_call(monkeypatch):
+    scripted_get(monkeypatch, [503] * studio_client.MAX_ATTEMPTS + [httpx.ReadTimeout("slow")] * studio_client.MAX_ATTEMPTS)
+
+    async def fail_twice():
+        for path in ("unavailable", "timing-out"):
+            with pytest.raises((httpx.HTTPStatusError, httpx.TransportError)):
+                await studio_client.get_json(f"{ORIGIN}/{path}")
+
+    asyncio.run(fail_twice())
+
+    breaker = studio_client.get_breaker(studio_client.DEFAULT_ENDPOINT_CLASS)
+    assert breaker.consecutive_failures == 2
+    assert breaker.state == "closed"
+
+
+def test_hedge_records_the_primary_latency(monkeypatch):
+    calls = scripted_get(monkeypatch, [(0.2, 200), 200])
+    tracker = studio_client._latencies[studio_client.DEFAULT_ENDPOINT_CLASS] = studio_client.LatencyTracker()
+    for _ in range(studio_client.HEDGE_MIN_SAMPLES):
+        tracker.record(0.01)
+
+    async def fetch():
+        started = asyncio.get_running_loop().time()
+        body = await studio_client.get_json(f"{ORIGIN}/hedged")
+        elapsed = asyncio.get_running_loop().time() - started
+        await asyncio.sleep(0.3)
+        return body, elapsed
+
+    body, elapsed = asyncio.run(fetch())
+
+    assert body == {"status": 200}
+    assert len(calls) == 2
+    assert elapsed < 0.2
+    # The hedge answered, but the sample is the primary's own (slow) latency.
+    assert len(tracker.samples) == studio_client.HEDGE_MIN_SAMPLES + 1
+    assert tracker.samples[-1] >= 0.2
+
+
+def test_breaker_opens_probes_and_closes(monkeypatch):
+    calls = scripted_get(monkeypatch, [500, 500, (0.05, 200)])
+    breaker = studio_client._breakers[studio_client.DEFAULT_ENDPOINT_CLASS] = studio_client.CircuitBreaker(
+        studio_client.DEFAULT_ENDPOINT_CLASS, failures=2, reset=0.05
+    )
+
+    async def run():
+        for index in range(2):
+            with pytest.raises(httpx.HTTPStatusError):
+                await studio_client.get_json(f"{ORIGIN}/failing/{index}")
+        assert breaker.state == "open"
+        with pytest.raises(studio_client.CircuitOpenError):
+            await studio_client.get_json(f"{ORIGIN}/rejected")
+
+        await asyncio.sleep(0.06)
+        probe = asyncio.ensure_future(studio_client.get_json(f"{ORIGIN}/probe"))
+        await asyncio.sleep(0.01)
+        assert breaker.state == "half-open"
+        with pytest.raises(studio_client.CircuitOpenError):
+            await studio_client.get_json(f"{ORIGIN}/during-probe")
+        assert await probe == {"status": 200}
+        assert breaker.state == "closed"
+
+    asyncio.run(run())
+    assert calls == [f"{ORIGIN}/failing/0", f"{ORIGIN}/failing/1", f"{ORIGIN}/probe"]
+
+
+def test_only_a_cancelled_probe_frees_the_half_open_breaker(monkeypatch):
+    calls = scripted_get(monkeypatch, [(1, 200), (1, 200), (0.05, 200)])
+    breaker = studio_client._breakers[studio_client.DEFAULT_ENDPOINT_CLASS] = studio_client.CircuitBreaker(
+        studio_client.DEFAULT_ENDPOINT_CLASS, failures=1, reset=0
+    )
+
+    async def run():
+        # Started while the breaker is closed, like a speculative fetch that is cancelled later.
+        speculative = asyncio.ensure_future(studio_client.get_json(f"{ORIGIN}/speculative"))
+        await asyncio.sleep(0.01)
+        breaker.record_failure()
+        probe = asyncio.ensure_future(studio_client.get_json(f"{ORIGIN}/probe"))
+        await asyncio.sleep(0.01)
+
+        speculative.cancel()
+        await asyncio.sleep(0.01)
+        assert breaker.state == "half-open"
+        with pytest.raises(studio_client.CircuitOpenError):
+            await studio_client.get_json(f"{ORIGIN}/second-probe")
+
+        probe.cancel()
+        await asyncio.sleep(0.01)
+        assert breaker.state == "open"
+        assert await studio_client.get_json(f"{ORIGIN}/next-probe") == {"status": 200}
+        assert breaker.state == "closed"
+
+    asyncio.run(run())
+    assert calls == [f"{ORIGIN}/speculative", f"{ORIGIN}/probe", f"{ORIGIN}/next-probe"]
+
+
+def test_cancelling_a_retry_that_holds_the_probe_frees_the_breaker(monkeypatch):
+    calls = scripted_get(monkeypatch, [(0.02, 503), 200])
+    monkeypatch.setattr(studio_client, "RETRY_BASE_DELAY", 1)
+    breaker = studio_client._breakers[studio_client.DEFAULT_ENDPOINT_CLASS] = studio_client.CircuitBreaker(
+        studio_client.DEFAULT_ENDPOINT_CLASS, failures=1, reset=0
+    )
+
+    async def run():
+        retrying = asyncio.ensure_future(studio_client.get_json(f"{ORIGIN}/retrying"))
+        await asyncio.sleep(0.01)
+        # Another call fails meanwhile, so the permit for the retry is the half-open probe.
+        breaker.record_failure()
+        await asyncio.sleep(0.03)
+        assert breaker.state == "half-open"
+
+        retrying.cancel()
+        await asyncio.sleep(0.01)
+        assert breaker.state == "open"
+        assert await studio_client.get_json(f"{ORIGIN}/next-probe") == {"status": 200}
+        assert breaker.state == "closed"
+
+    asyncio.run(run())
+    assert calls == [f"{ORIGIN}/retrying", f"{ORIGIN}/next-probe"]
+
+
+def test_identical_concurrent_fetches_share_one_request(monkeypatch):
+    calls = scripted_get(monkeypatch, [(0.02, 200), (0.02, 200)])
+
+    async def fetch_all():
+        same_scope = [studio_client.get_json(f"{ORIGIN}/shared", {"Cookie": "a"}) for _ in range(5)]
+        other_scope = studio_client.get_json(f"{ORIGIN}/shared", {"Cookie": "b"})
+        return await asyncio.gather(*same_scope, other_scope)
+
+    results = asyncio.run(fetch_all())
+
+    assert len(calls) == 2
+    assert all(result is results[0] for result in results[:5])
+    assert results[5] is not results[0]
+
+
+def test_shared_fetch_is_cancelled_only_with_its_last_waiter():
+    started = []
+    cancelled = []
+
+    async def fetch():
+        started.append(True)
+        try:
+            await asyncio.sleep(0.05)
+            return "body"
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def run():
+        first = asyncio.ensure_future(studio_client.coalesce("cancel-one", fetch))
+        second = asyncio.ensure_future(studio_client.coalesce("cancel-one", fetch))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        assert await second == "body"
+        assert not cancelled
+
+        third = asyncio.ensure_future(studio_client.coalesce("cancel-all", fetch))
+        await asyncio.sleep(0.01)
+        third.cancel()
+        await asyncio.sleep(0.01)
+        assert cancelled
+
+    asyncio.run(run())
+    assert len(started) == 2
+
+
+def test_caller_arriving_while_a_cancelled_fetch_winds_down_gets_a_fresh_one():
+    runs = []
+
+    async def fetch():
+        runs.append(True)
+        try:
+            await asyncio.sleep(0.05)
+            return len(runs)
+        finally:
+            # Like closing an httpx response, cleanup awaits before the task is done.
+            await asyncio.sleep(0.01)
+
+    async def run():
+        abandoned = asyncio.ensure_future(studio_client.coalesce("late", fetch))
+        await asyncio.sleep(0.01)
+        abandoned.cancel()
+        await asyncio.sleep(0)
+        return await studio_client.coalesce("late", fetch)
+
+    assert asyncio.run(run()) == 2
+
+
+def test_unchanged_resources_are_revalidated_with_their_validators(monkeypatch):
+    sent = []
+
+    async def get(url, headers=None, timeout=None):
+        sent.append({name: headers.get(name) for name in ("If-None-Match", "If-Modified-Since")})
+        request = httpx.Request("GET", url, headers=headers)
+        validators = {"ETag": '"v1"', "Last-Modified": "Mon, 05 Oct 2026 10:00:00 GMT"}
+        if headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers=validators, request=request)
+        return httpx.Response(200, json={"version": 1}, headers=validators, request=request)
+
+    monkeypatch.setattr(studio_client, "get", get)
+
+    async def fetch_twice():
+        return [await studio_client.get_json(f"{ORIGIN}/validated", {"Cookie": "a"}) for _ in range(2)]
+
+    first, second = asyncio.run(fetch_twice())
+
+    assert second is first
+    assert sent == [
+        {"If-None-Match": None, "If-Modified-Since": None},
+        {"If-None-Match": '"v1"', "If-Modified-Since": "Mon, 05 Oct 2026 10:00:00 GMT"},
+    ]
+
+
+def test_missing_resources_are_remembered_but_server_errors_are_not(monkeypatch):
+    calls = scripted_get(monkeypatch, [404, 200, 500, 500, 401])
+
+    async def run():
+        with pytest.raises(httpx.HTTPStatusError):
+            await studio_client.get_json(f"{ORIGIN}/missing")
+        with pytest.raises(studio_client.RecentFailureError) as error:
+            await studio_client.get_json(f"{ORIGIN}/missing")
+        assert error.value.status_code == 404
+        studio_client.forget_failure(f"{ORIGIN}/missing")
+        assert await studio_client.get_json(f"{ORIGIN}/missing") == {"status": 200}
+
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPStatusError):
+                await studio_client.get_json(f"{ORIGIN}/failing-server")
+
+        # Rejected credentials are remembered for the auth scope, on every URL.
+        with pytest.raises(httpx.HTTPStatusError):
+            await studio_client.get_json(f"{ORIGIN}/private", {"Cookie": "expired"})
+        with pytest.raises(studio_client.RecentFailureError):
+            await studio_client.get_json(f"{ORIGIN}/other", {"Cookie": "expired"})
+
+    asyncio.run(run())
+    assert calls == [f"{ORIGIN}/missing"] * 2 + [f"{ORIGIN}/failing-server"] * 2 + [f"{ORIGIN}/private"]
@@ -0,0 +1,71 @@
+import asyncio
+import json
+
+import httpx
+
+import context_extractor
+import studio_client
+from studio_fakes import encode, fake_get
+
+PROJECT_ID = "VariablesProject"
+PROJECT_PATH = f"/studio/services/projects/{PROJECT_ID}"
+TYPES = {"types": {"Order": {"fields": {"id": {"type": "integer"}, "total": {"type": "number"}}}}}
+VARIABLES = {
+    "orders": {"category": "wm.ServiceVariable", "service": "shop", "operationId": "listOrders", "type": "Order"}
+}
+
+
+def counting_get(resources, requests):
+    get = fake_get(resources)
+
+    async def counting(url, headers=None, timeout=None):
+        requests.append(httpx.URL(url).path)
+        return await get(url, headers=headers, timeout=timeout)
+    return counting
+
+
+def test_missing_service_definitions_are_cached_as_empty(monkeypatch):
+    types_path = f"{PROJECT_PATH}/services/shop/types"
+    requests = []
+    monkeypatch.setattr(studio_client, "get", counting_get({types_path: TYPES}, requests))
+    encoded_variables = encode(json.dumps(VARIABLES))
+
+    async def resolve_three_times():
+        return [
+            await context_extractor.get_encoded_variables(encoded_variables, PROJECT_ID, "cookie")
+            for _ in range(3)
+        ]
+
+    results = asyncio.run(resolve_three_times())
+
+    assert requests.count(types_path) == 1
+    assert (context_extractor.origin, PROJECT_ID, "shop") in context_extractor._service_catalogs._entries
+    variables, _ = results[0]
+    assert variables["orders"]["parameters"] == []
+    assert variables["orders"]["dataSet"] == [{"name": "id", "type": "integer"}, {"name": "total", "type": "number"}]
+    # The memoized resolution matches the cached catalog, so it is the same result every time.
+    assert results[1] is results[0] and results[2] is results[0]
+
+
+def test_transient_service_failures_are_not_cached(monkeypatch):
+    project_id = "FlakyVariablesProject"
+    requests = []
+    get = counting_get({}, requests)
+
+    async def unavailable(url, headers=None, timeout=None):
+        await get(url, headers=headers, timeout=timeout)
+        return httpx.Response(500, request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(studio_client, "get", unavailable)
+    # Keep these failures from counting toward the breakers seen by other tests.
+    monkeypatch.setattr(studio_client, "_breakers", {})
+    variables_json = {name: dict(details) for name, details in VARIABLES.items()}
+
+    async def resolve_twice():
+        for _ in range(2):
+            await context_extractor.get_variables(variables_json, project_id, "cookie")
+
+    asyncio.run(resolve_twice())
+
+    assert (context_extractor.origin, project_id, "shop") not in context_extractor._service_catalogs._entries
+    assert requests.count(f"/studio/services/projects/{project_id}/services/shop/types") == 2
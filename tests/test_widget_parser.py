@@ -0,0 +1,78 @@
+import json
+import random
+
+import pytest
+
+import context_extractor
+from studio_fakes import studio_markup
+
+CASES = {
+    "void tags": '<wm-page name="p"><wm-form name="f"><input name="in"><br><img caption="logo">'
+                 '<wm-text name="t"></wm-text></wm-form></wm-page>',
+    "self-closing tags": '<wm-page name="p"><wm-list name="l"><wm-label name="a"/><wm-button name="b" type="submit"/>'
+                         '</wm-list><wm-label name="a"/></wm-page>',
+    "self-closing void tag after a void tag": '<wm-page name="p"><br><br name="b"/><wm-form name="f"></br>'
+                                              '<wm-liveform name="inner"></wm-liveform></wm-form></wm-page>',
+    "stray end tags": '<wm-page name="p"></wm-form><wm-form name="f"><wm-text name="t"></div></wm-text></wm-list>'
+                      '</wm-form><wm-button name="after"></wm-button></wm-page>',
+    "unclosed tags": '<wm-page name="p"><wm-list name="l"><wm-label name="a"><wm-table name="t">'
+                     '<wm-table-column caption="c" name="col"></wm-page>',
+    "nested forms, lists and tables": (
+        '<wm-page name="p"><wm-form name="outer"><wm-list name="items" dataset="bind:x">'
+        '<wm-label name="itemLabel" caption="Item"></wm-label><wm-table name="grid">'
+        '<wm-table-column name="id" caption="Id" type="number"></wm-table-column><wm-button name="edit"></wm-button>'
+        '</wm-table></wm-list><wm-liveform name="inner"><wm-form-field name="field" widget="text"></wm-form-field>'
+        '</wm-liveform></wm-form></wm-page>'
+    ),
+    "partial containers with params": (
+        '<wm-page name="p"><wm-container name="c" content="Header"><wm-param name="title" type="string">'
+        '</wm-param><wm-panel name="inner" content="Body"><wm-param name="id" type="number"/></wm-panel>'
+        '</wm-container><wm-tabpane name="tab" content=" Tab "><wm-list name="l"><wm-param name="x"></wm-param>'
+        '</wm-list></wm-tabpane><wm-container name="plain"><wm-text name="t"></wm-text></wm-container></wm-page>'
+    ),
+    "events and attributes": '<wm-partial name="p"><wm-button name="b" on-click="go()" iconclass="fa" caption="Go" '
+                             'datafield="id" disabled></wm-button></wm-partial>',
+    "prefab root": '<wm-prefab-container name="p"><wm-label name="l"></wm-label></wm-prefab-container>',
+}
+
+TAGS = [
+    "wm-page", "wm-form", "wm-liveform", "wm-list", "wm-table", "wm-card", "wm-container", "wm-panel", "wm-tabpane",
+    "wm-table-column", "wm-form-field", "wm-param", "wm-label", "wm-button", "wm-text", "div", "input", "br", "img",
+]
+ATTRIBUTES = ["name", "caption", "type", "widget", "dataset", "content", "on-click", "iconclass", "datafield"]
+
+
+def random_markup(rng):
+    parts = []
+    for _ in range(rng.randint(1, 40)):
+        tag = rng.choice(TAGS)
+        kind = rng.random()
+        if kind < 0.15:
+            parts.append(f"</{tag}>")
+            continue
+        attrs = "".join(
+            f' {attr}="{rng.choice("abcde")}{rng.randint(0, 5)}"' for attr in rng.sample(ATTRIBUTES, rng.randint(0, 4))
+        )
+        parts.append(f"<{tag}{attrs}/>" if kind < 0.3 else f"<{tag}{attrs}>")
+    return "".join(parts)
+
+
+def assert_same_extraction(root):
+    encoded = studio_markup(root)
+    expected = context_extractor.parse_widgets_bs4(encoded)
+    actual = context_extractor._parse_widgets(encoded)
+    assert actual.page_type == expected.page_type
+    # Key order is part of the result, so compare the serialized form as well.
+    assert json.dumps(actual.widgets) == json.dumps(expected.widgets)
+    assert json.dumps(actual.partial_widgets) == json.dumps(expected.partial_widgets)
+
+
+@pytest.mark.parametrize("root", CASES.values(), ids=CASES.keys())
+def test_stream_parser_matches_bs4(root):
+    assert_same_extraction(root)
+
+
+def test_stream_parser_matches_bs4_on_random_markup():
+    rng = random.Random(4)
+    for _ in range(2000):
+        assert_same_extraction(random_markup(rng))